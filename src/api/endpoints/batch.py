@@ -4,6 +4,7 @@ API endpoints for CSV batch processing functionality
 """
 from fastapi import APIRouter, File, UploadFile, HTTPException, BackgroundTasks
 from typing import List, Dict, Any, Optional
+import asyncio
 import csv
 import io
 import uuid
@@ -12,6 +13,7 @@ from datetime import datetime
 from ...core.models import FeatureAnalysisRequest, FeatureAnalysisResponse
 from ...core.workflow import EnhancedWorkflowOrchestrator
 from ...core.database import db_manager, ComplianceReportRepository, BatchJobDB
+from ...config import settings
 
 router = APIRouter(prefix="/api/v1/batch", tags=["batch"])
 
@@ -396,22 +398,25 @@ async def _process_bulk_requirements(job_id: str, requirements_doc_ids: List[str
         db_session = next(db_manager.get_db_session())
         report_repo = ComplianceReportRepository(db_session)
         
-        for i, req_doc_id in enumerate(requirements_doc_ids):
+        # Build MCP filter for the legal documents (same for every requirements document)
+        if legal_doc_ids:
+            legal_filter = f" AND document_id IN ({','.join([f'doc-{doc_id}' for doc_id in legal_doc_ids])})"
+        else:
+            legal_filter = ""
+        slots = asyncio.Semaphore(settings.batch_max_concurrency)
+        completed: Dict[int, tuple] = {}  # document index -> (result, report_id)
+        
+        async def process_document(i: int, req_doc_id: str) -> None:
             try:
-                # Build MCP query for this requirements document against legal documents
-                if legal_doc_ids:
-                    legal_filter = f" AND document_id IN ({','.join([f'doc-{doc_id}' for doc_id in legal_doc_ids])})"
-                else:
-                    legal_filter = ""
-                
                 mcp_query = f"document_id:{req_doc_id}{legal_filter}"
                 
                 # Use workflow to process via lawyer agent with MCP call
-                result = await workflow.process_bulk_requirements_analysis(
-                    requirements_document_id=req_doc_id,
-                    legal_document_filter=legal_filter,
-                    mcp_query=mcp_query
-                )
+                async with slots:
+                    result = await workflow.process_bulk_requirements_analysis(
+                        requirements_document_id=req_doc_id,
+                        legal_document_filter=legal_filter,
+                        mcp_query=mcp_query
+                    )
                 
                 # Save report to database
                 report_data = {
@@ -429,8 +434,7 @@ async def _process_bulk_requirements(job_id: str, requirements_doc_ids: List[str
                 }
                 
                 report_id = await report_repo.save_report(report_data)
-                job['results'].append(result)
-                job['report_ids'].append(report_id)
+                completed[i] = (result, report_id)
                 job['processed_documents'] += 1
                 
             except Exception as e:
@@ -441,6 +445,15 @@ async def _process_bulk_requirements(job_id: str, requirements_doc_ids: List[str
                 }
                 job['errors'].append(error)
         
+        # Documents are independent: analyze them concurrently (bounded), each saving its own report
+        await asyncio.gather(*(process_document(i, req_doc_id) for i, req_doc_id in enumerate(requirements_doc_ids)))
+        
+        # Documents finish in any order - publish results and report ids in document order
+        for i in sorted(completed):
+            result, report_id = completed[i]
+            job['results'].append(result)
+            job['report_ids'].append(report_id)
+        
         job['status'] = 'completed'
         job['completion_time'] = datetime.now()
         
@@ -461,22 +474,25 @@ async def _process_bulk_legal(job_id: str, legal_doc_ids: List[str], requirement
         db_session = next(db_manager.get_db_session())
         report_repo = ComplianceReportRepository(db_session)
         
-        for i, legal_doc_id in enumerate(legal_doc_ids):
+        # Build MCP filter for the requirements documents (same for every legal document)
+        if requirements_doc_ids:
+            req_filter = f" AND document_id IN ({','.join([f'req-{doc_id}' for doc_id in requirements_doc_ids])})"
+        else:
+            req_filter = ""
+        slots = asyncio.Semaphore(settings.batch_max_concurrency)
+        completed: Dict[int, tuple] = {}  # document index -> (result, report_id)
+        
+        async def process_document(i: int, legal_doc_id: str) -> None:
             try:
-                # Build MCP query for this legal document against requirements documents
-                if requirements_doc_ids:
-                    req_filter = f" AND document_id IN ({','.join([f'req-{doc_id}' for doc_id in requirements_doc_ids])})"
-                else:
-                    req_filter = ""
-                
                 mcp_query = f"document_id:{legal_doc_id}{req_filter}"
                 
                 # Use workflow to process via lawyer agent with MCP call
-                result = await workflow.process_bulk_legal_analysis(
-                    legal_document_id=legal_doc_id,
-                    requirements_document_filter=req_filter,
-                    mcp_query=mcp_query
-                )
+                async with slots:
+                    result = await workflow.process_bulk_legal_analysis(
+                        legal_document_id=legal_doc_id,
+                        requirements_document_filter=req_filter,
+                        mcp_query=mcp_query
+                    )
                 
                 # Save report to database
                 report_data = {
@@ -494,8 +510,7 @@ async def _process_bulk_legal(job_id: str, legal_doc_ids: List[str], requirement
                 }
                 
                 report_id = await report_repo.save_report(report_data)
-                job['results'].append(result)
-                job['report_ids'].append(report_id)
+                completed[i] = (result, report_id)
                 job['processed_documents'] += 1
                 
             except Exception as e:
@@ -506,6 +521,15 @@ async def _process_bulk_legal(job_id: str, legal_doc_ids: List[str], requirement
                 }
                 job['errors'].append(error)
         
+        # Documents are independent: analyze them concurrently (bounded), each saving its own report
+        await asyncio.gather(*(process_document(i, legal_doc_id) for i, legal_doc_id in enumerate(legal_doc_ids)))
+        
+        # Documents finish in any order - publish results and report ids in document order
+        for i in sorted(completed):
+            result, report_id = completed[i]
+            job['results'].append(result)
+            job['report_ids'].append(report_id)
+        
         job['status'] = 'completed'
         job['completion_time'] = datetime.now()
         
@@ -19,6 +19,8 @@ from urllib.parse import urlparse
 import re
 
 from ...core.database import db_manager, DocumentRepository
+from ...core.agents.lawyer_agent import LawyerAgent
+from ...core.agents.real_mcp_client import get_shared_mcp_client
 
 router = APIRouter(prefix="/api/documents", tags=["document-management"])
 
@@ -212,6 +214,7 @@ async def update_knowledge_base(request: dict):
     success = update_knowledge_base_content(request["content"])
     
     if success:
+        LawyerAgent.reload_prompts()
         return {"message": "Knowledge base updated successfully"}
     else:
         raise HTTPException(status_code=500, detail="Failed to update knowledge base")
@@ -231,6 +234,7 @@ async def update_system_prompt(request: dict):
     success = update_system_prompt_content(request["content"])
     
     if success:
+        LawyerAgent.reload_prompts()
         return {"message": "System prompt updated successfully"}
     else:
         raise HTTPException(status_code=500, detail="Failed to update system prompt")
@@ -596,23 +600,24 @@ async def _forward_to_requirements_mcp(file_path: Path, document_id: str, filena
     requirements_mcp_url = os.getenv('REQUIREMENTS_MCP_URL', 'http://localhost:8011')
     
     try:
-        async with aiohttp.ClientSession() as session:
-            with open(file_path, 'rb') as file:
-                data = aiohttp.FormData()
-                data.add_field('file', file, filename=filename)
-                data.add_field('document_type', 'prd')
-                data.add_field('document_id', document_id)  # Pass the same document ID
-                
-                async with session.post(
-                    f"{requirements_mcp_url}/api/v1/upload",
-                    data=data
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        print(f"✅ Document forwarded to Requirements MCP with ID {document_id}: {result}")
-                    else:
-                        response_text = await response.text()
-                        print(f"❌ Failed to forward to Requirements MCP: HTTP {response.status} - {response_text}")
+        # Reuse the shared MCP client's keep-alive connection pool for this server
+        session = await get_shared_mcp_client().http_session(requirements_mcp_url)
+        with open(file_path, 'rb') as file:
+            data = aiohttp.FormData()
+            data.add_field('file', file, filename=filename)
+            data.add_field('document_type', 'prd')
+            data.add_field('document_id', document_id)  # Pass the same document ID
+            
+            async with session.post(
+                "/api/v1/upload",
+                data=data
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    print(f"✅ Document forwarded to Requirements MCP with ID {document_id}: {result}")
+                else:
+                    response_text = await response.text()
+                    print(f"❌ Failed to forward to Requirements MCP: HTTP {response.status} - {response_text}")
                         
     except Exception as e:
         print(f"❌ Error forwarding to Requirements MCP: {e}")
@@ -622,27 +627,28 @@ async def _forward_to_legal_mcp(file_path: Path, document_id: str, filename: str
     legal_mcp_url = os.getenv('LEGAL_MCP_URL', 'http://localhost:8010')
     
     try:
-        async with aiohttp.ClientSession() as session:
-            with open(file_path, 'rb') as file:
-                data = aiohttp.FormData()
-                data.add_field('file', file, filename=filename)
-                data.add_field('document_type', 'legal')
-                
-                # Add jurisdiction and law title if provided
-                if metadata.get('jurisdiction'):
-                    data.add_field('jurisdiction', metadata['jurisdiction'])
-                if metadata.get('law_title'):
-                    data.add_field('law_title', metadata['law_title'])
-                
-                async with session.post(
-                    f"{legal_mcp_url}/api/v1/upload",
-                    data=data
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        print(f"✅ Document forwarded to Legal MCP: {result}")
-                    else:
-                        print(f"❌ Failed to forward to Legal MCP: HTTP {response.status}")
+        # Reuse the shared MCP client's keep-alive connection pool for this server
+        session = await get_shared_mcp_client().http_session(legal_mcp_url)
+        with open(file_path, 'rb') as file:
+            data = aiohttp.FormData()
+            data.add_field('file', file, filename=filename)
+            data.add_field('document_type', 'legal')
+            
+            # Add jurisdiction and law title if provided
+            if metadata.get('jurisdiction'):
+                data.add_field('jurisdiction', metadata['jurisdiction'])
+            if metadata.get('law_title'):
+                data.add_field('law_title', metadata['law_title'])
+            
+            async with session.post(
+                "/api/v1/upload",
+                data=data
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    print(f"✅ Document forwarded to Legal MCP: {result}")
+                else:
+                    print(f"❌ Failed to forward to Legal MCP: HTTP {response.status}")
                         
     except Exception as e:
         print(f"❌ Error forwarding to Legal MCP: {e}")
\ No newline at end of file
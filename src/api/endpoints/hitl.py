@@ -349,7 +349,7 @@ async def execute_lawyer_workflow(workflow_id: str):
                 "analysis_type": "requirements_compliance_check"
             }
         }
-        compliance_report = await lawyer_agent.handle_user_query(query_data)
+        compliance_report = await lawyer_agent.handle_user_query(query_data, hedge=False)
         
         await update_progress(workflow_id, "Analysis complete with MCP data", 4, 4, 100)
         
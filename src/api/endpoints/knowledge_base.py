@@ -6,6 +6,8 @@ from typing import Dict
 from pydantic import BaseModel
 import os
 
+from ...core.agents.lawyer_agent import LawyerAgent
+
 router = APIRouter(prefix="/api/documents", tags=["knowledge-base"])
 
 # Configuration storage - in production use database
@@ -53,6 +55,7 @@ async def update_knowledge_base(request: ContentRequest) -> Dict[str, str]:
     try:
         with open(KNOWLEDGE_BASE_FILE, 'w', encoding='utf-8') as f:
             f.write(request.content)
+        LawyerAgent.reload_prompts()
             
         return {"message": "Knowledge base updated successfully"}
         
@@ -93,6 +96,7 @@ async def update_system_prompt(request: ContentRequest) -> Dict[str, str]:
     try:
         with open(SYSTEM_PROMPT_FILE, 'w', encoding='utf-8') as f:
             f.write(request.content)
+        LawyerAgent.reload_prompts()
             
         return {"message": "System prompt updated successfully"}
         
@@ -27,6 +27,9 @@ from .hitl import WorkflowStartRequest, active_workflows, send_hitl_prompt, wait
 router = APIRouter(prefix="/api", tags=["legal-chat"])
 logger = logging.getLogger(__name__)
 
+# Document id embedded in an MCP query ("... document_id:<uuid> ...")
+_DOCUMENT_ID_RE = re.compile(r'document_id:([a-f0-9\-]+)')
+
 # Single unified LawyerAgent architecture with configurable prompts
 lawyer_agent = LawyerAgent()  # Legacy instance for compatibility
 enhanced_lawyer_agent = LawyerAgent()  # Main instance for autonomous workflows
@@ -782,7 +785,7 @@ async def _agent_execute_mcp_call(session_id: str, action: AgentAction):
             # Parse query to determine search type
             if "document_id:" in query:
                 # Extract document ID from query like "document_id:abc-123 full content analysis"
-                doc_id_match = re.search(r'document_id:([a-f0-9\-]+)', query)
+                doc_id_match = _DOCUMENT_ID_RE.search(query)
                 if doc_id_match:
                     document_id = doc_id_match.group(1)
                     result = await lawyer_agent.requirements_mcp.search_requirements(
@@ -797,7 +800,7 @@ async def _agent_execute_mcp_call(session_id: str, action: AgentAction):
                     )
             elif "check_document_status" in query:
                 # Extract document ID for status check
-                doc_id_match = re.search(r'document_id:([a-f0-9\-]+)', query)
+                doc_id_match = _DOCUMENT_ID_RE.search(query)
                 if doc_id_match:
                     document_id = doc_id_match.group(1)
                     # Use bulk_retrieve to check if document exists
@@ -1080,7 +1083,7 @@ async def _execute_approved_mcp_call(session_id: str):
             query = tool_decision["query"]
             if "document_id:" in query:
                 # Extract document ID from query like "document_id:abc-123 full content analysis"
-                doc_id_match = re.search(r'document_id:([a-f0-9\-]+)', query)
+                doc_id_match = _DOCUMENT_ID_RE.search(query)
                 if doc_id_match:
                     document_id = doc_id_match.group(1)
                     result = await lawyer_agent.requirements_mcp.search_requirements(
@@ -1095,7 +1098,7 @@ async def _execute_approved_mcp_call(session_id: str):
                     )
             elif "check_document_status" in query:
                 # Extract document ID for status check
-                doc_id_match = re.search(r'document_id:([a-f0-9\-]+)', query)
+                doc_id_match = _DOCUMENT_ID_RE.search(query)
                 if doc_id_match:
                     document_id = doc_id_match.group(1)
                     result = await lawyer_agent.requirements_mcp.search_requirements(
@@ -33,9 +33,35 @@ class Settings(BaseSettings):
     max_concurrent_analyses: int = 10
     llm_timeout_seconds: int = 30
     
+    # LLM output budgets per path (output tokens dominate completion latency)
+    llm_max_tokens_advice: int = 400
+    llm_max_tokens_fallback_advice: int = 300
+    llm_max_tokens_feature_analysis: int = 700
+    
+    # Small per-provider models for the "fast" tier (fallback advice, the hedged
+    # draft answer and short parse prompts); the main analysis stays on the preferred model
+    llm_fast_gemini_model: str = "gemini-1.5-flash-8b"
+    llm_fast_claude_model: str = "claude-3-5-haiku-20241022"
+    llm_fast_openai_model: str = "gpt-4o-mini"
+    
+    # Process-wide cap on concurrent LLM provider calls
+    llm_max_concurrency: int = 8
+    
+    # Budget for MCP search content embedded in an advice prompt (~4 chars per token),
+    # so long documents can't push the prompt past the model context
+    llm_legal_context_max_chars: int = 24000
+    
+    # User-query MCP search: start a context-free draft after the hedge delay, and
+    # answer with the draft if the search hasn't returned by the timeout
+    mcp_search_hedge_seconds: float = 1.0
+    mcp_search_timeout_seconds: float = 8.0
+    
     # Feature Flags - Streamlined for hackathon scope  
     enable_batch_processing: bool = False
     
+    # Documents analyzed concurrently by a bulk requirements/legal analysis job
+    batch_max_concurrency: int = 4
+    
     # MCP Service URLs - Original architecture
     utah_mcp_url: str = "http://localhost:8010"
     eu_mcp_url: str = "http://localhost:8011"
@@ -2,23 +2,397 @@
 Lawyer Agent - Enhanced Implementation
 Central coordinator for legal analysis with autonomous workflow capabilities
 """
-from typing import List, Dict, Any, Optional, Callable
-import statistics
-from datetime import datetime
+from typing import List, Dict, Any, Optional, Callable, AsyncIterator, Tuple, FrozenSet
+from datetime import datetime, timezone
 import uuid
+import hashlib
 import json
 import re
+import time
 import asyncio
 import logging
-from pydantic import BaseModel
+from collections import OrderedDict
+from functools import lru_cache
+from pydantic import BaseModel, PrivateAttr
 
 from ..models import JurisdictionAnalysis, FeatureAnalysisResponse, UserQueryResponse
-from .real_mcp_client import RealMCPClient
-from ..llm_service import llm_client
+from .real_mcp_client import get_shared_mcp_client, MCP_CONNECTIONS_PER_SERVER
+from ..llm_service import llm_client, create_llm_client
 from ..config_manager import get_system_prompt, get_knowledge_base
+from ...config import settings
+
+try:
+    import orjson
+except ImportError:  # optional speedup, falls back to stdlib json
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Reasoning steps kept per session (older ones are folded into counters) and shown to the LLM
+MAX_REASONING_STEPS = 50
+REASONING_CONTEXT_STEPS = 20
+
+def _loads_json(text: str) -> Any:
+    """json.loads via orjson when available; both raise json.JSONDecodeError subclasses"""
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+def _extract_json_object(text: str, brackets: str = "{}") -> str:
+    """
+    Outermost {...} (or [...] with brackets="[]") in text by a single bracket-depth scan
+    (string literals respected)
+    Returns the stripped text unchanged when no balanced object is found
+    """
+    opener, closer = brackets
+    start = text.find(opener)
+    if start < 0:
+        return text.strip()
+    depth = 0
+    in_string = escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == opener:
+            depth += 1
+        elif char == closer:
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return text.strip()
+
+def _parse_llm_json(content: str) -> Any:
+    """Parse a JSON object from LLM output: fenced block, else the first balanced object"""
+    fence_match = _JSON_FENCE_RE.search(content)
+    json_str = fence_match.group(1) if fence_match else _extract_json_object(content)
+    return _loads_json(json_str)
+
+def _compact_json(obj: Any, sort_keys: bool = False) -> str:
+    """Compact JSON for prompt context and cache keys (orjson when available)"""
+    if orjson is not None:
+        try:
+            option = orjson.OPT_SORT_KEYS if sort_keys else 0
+            return orjson.dumps(obj, default=str, option=option).decode()
+        except TypeError:
+            pass  # e.g. non-str dict keys; stdlib handles these
+    return json.dumps(obj, sort_keys=sort_keys, default=str, separators=(',', ':'))
+
+# Prompt configuration is static between admin edits; read it once so every prompt
+# shares a byte-identical prefix (required for provider-side prefix caching).
+# LawyerAgent.reload_prompts() invalidates after the config files are updated.
+@lru_cache(maxsize=1)
+def _cached_system_prompt() -> str:
+    return get_system_prompt()
+
+@lru_cache(maxsize=1)
+def _cached_knowledge_base() -> str:
+    return get_knowledge_base()
+
+# Phrases indicating compliance obligations in free-text LLM output,
+# compiled into a single alternation so the text is scanned once
+COMPLIANCE_PHRASES = [
+    "compliance required", "regulatory requirements", "must comply", 
+    "violation", "regulation applies", "legal requirements"
+]
+_COMPLIANCE_PHRASE_RE = re.compile("|".join(re.escape(phrase) for phrase in COMPLIANCE_PHRASES))
+
+# Key regulatory concerns surfaced in decision reasoning, keyed by lowercase jurisdiction
+_CONCERNS_MAP = {
+    "utah": "Utah Social Media Act restrictions",
+    "eu": "EU transparency and user rights requirements"
+}
+
+# Static instruction blocks for the autonomous workflow prompts. These are sent as the
+# cacheable system prefix, so they must stay byte-identical between calls.
+DECISION_INSTRUCTIONS = """=== DECISION FORMAT ===
+Respond with exactly this format:
+
+ACTION_TYPE: [mcp_call|analysis|response|hitl_prompt]
+REASONING: [Your strategic reasoning for this choice - 1-2 sentences]
+RESPONSE_CONTENT: [If action_type is "response", provide focused compliance gap report ONLY]
+DETAILS: [For other action types: specific MCP query, analysis focus, etc.]
+
+=== WORKFLOW PROGRESSION RULES ===
+- mcp_call: Use when you need MORE information (requirements OR legal rules) AND tool calls < 3
+- analysis: Use when you have BOTH requirements AND legal context to analyze OR tool calls >= 3
+- response: Use when analysis is COMPLETE and ready to provide final compliance report
+- CRITICAL: If tool calls >= 3, you MUST choose analysis or response, NEVER mcp_call
+- AVOID: Repeating similar MCP calls - move to next workflow step
+- If "Just executed MCP: Yes", prefer analysis or response over another mcp_call"""
+
+# Output contract for the LLM-based feature analysis (static, part of the cacheable prefix)
+FEATURE_ANALYSIS_INSTRUCTIONS = """Provide compliance analysis in JSON format:
+{
+    "compliance_required": boolean,
+    "risk_level": integer (1-5 scale),
+    "applicable_jurisdictions": [relevant jurisdictions],
+    "requirements": [specific regulatory requirements],
+    "implementation_steps": [key implementation steps],
+    "reasoning": "explanation",
+    "confidence_score": float (0.0-1.0)
+}
+
+Respond ONLY with valid JSON."""
+
+# Output contract for the MCP reasoning step of feature analysis
+MCP_REASONING_INSTRUCTIONS = """Decide:
+- "call_mcps": Need more information - list EVERY tool call needed now; they run in parallel
+- "finalize": Have sufficient information
+
+JSON format:
+{
+    "action": "call_mcps" or "finalize",
+    "calls": [
+        {"mcp_tool_name": "exact_tool_name_from_list", "query_focus": "specific legal question"}
+    ],
+    "reasoning": "brief reason"
+}"""
+
+# Static rule blocks for the small LLM parsing prompts
+JURISDICTION_PARSE_RULES = """Rules:
+1. Match jurisdictions mentioned explicitly or through common abbreviations/synonyms
+2. "Global", "worldwide", "all regions" = ALL available jurisdictions
+3. "EU", "Europe", "European" = EU
+4. "CA", "Cali" = California
+5. "FL" = Florida
+6. "US", "America" without specifics = all US jurisdictions (Utah, California, Florida)
+7. If unclear or no matches, return empty list
+
+Return ONLY a JSON array of matched jurisdiction names: ["jurisdiction1", "jurisdiction2"]"""
+
+RISK_CATEGORY_HINTS = """Identify which risk categories apply based on the user's description. Consider:
+- "Payment", "financial", "money", "transactions" → payment processing
+- "Kids", "children", "minors", "under 18" → minor protection
+- "Personal data", "privacy", "information" → data processing
+- "Posts", "videos", "moderation" → content moderation
+- "Verify age", "age check" → age verification
+- "Reports", "transparency" → transparency reporting
+- "User rights", "access data" → user rights
+- "International", "cross-border" → cross-border data transfer
+
+Return ONLY a JSON array of matched category names: ["category1", "category2"]"""
+
+RISK_LEVEL_SCALE = """Risk Level Scale:
+1 = Minimal/No risk
+2 = Low risk  
+3 = Moderate risk
+4 = High risk
+5 = Critical risk
+
+Look for:
+- Explicit mentions like "risk level 3", "high risk", "critical"
+- Severity indicators: "minimal", "low", "moderate", "high", "critical"
+- Compliance implications: major violations = higher risk
+- Legal consequences mentioned
+
+Return ONLY a single integer 1-5: 3"""
+
+TEXT_CLASSIFICATION_INSTRUCTIONS = f"""Extract the risk level and the jurisdictions from this legal analysis text.
+
+{RISK_LEVEL_SCALE.rsplit(chr(10) + chr(10), 1)[0]}
+
+Jurisdictions: available jurisdictions the text applies to, matched explicitly or through
+abbreviations/synonyms ("EU", "Europe", "European" = EU; "CA", "Cali" = California; "FL" = Florida;
+"Global", "worldwide", "all regions" = ALL available jurisdictions); empty if none
+
+Respond ONLY with JSON: {{"risk_level": 3, "jurisdictions": []}}"""
+
+GEOGRAPHIC_CLASSIFICATION_RULES = """Classify the deployment scope in one pass:
+- is_global: GLOBAL or WORLDWIDE deployment ("global", "worldwide", "everywhere", "all regions",
+  "international", "all countries", "all markets", "universal deployment")
+- is_multiple: MULTIPLE SPECIFIC regions without naming them ("multiple", "several",
+  "specific regions", "some countries", "certain areas", "a few jurisdictions", "select markets")
+- jurisdictions: available jurisdictions named explicitly or through abbreviations/synonyms
+  ("EU", "Europe", "European" = EU; "CA", "Cali" = California; "FL" = Florida;
+  "US", "America" without specifics = Utah, California, Florida); empty if none
+
+Respond ONLY with JSON: {"is_global": false, "is_multiple": false, "jurisdictions": []}"""
+
+@lru_cache(maxsize=8)
+def _instruction_system(system_prompt: str, instructions: str) -> str:
+    """System prompt followed by a static instruction block, as one byte-stable prefix"""
+    return f"{system_prompt}\n\n{instructions}"
+
+@lru_cache(maxsize=8)
+def _knowledge_system(system_prompt: str, knowledge_base: str, instructions: str = "") -> str:
+    """System prompt + knowledge base (+ static instructions) as one byte-stable prefix"""
+    parts = [system_prompt, "", "Knowledge Base:", knowledge_base]
+    if instructions:
+        parts += ["", instructions]
+    return "\n".join(parts)
+
+# Static instruction blocks for the autonomous workflow's summary and final report calls
+CONVERSATION_SUMMARY_INSTRUCTIONS = """Summarize this legal compliance conversation in at most 200 tokens.
+Keep requirements, jurisdictions, MCP findings and decisions; drop pleasantries."""
+
+COMPLIANCE_REPORT_INSTRUCTIONS = """=== COMPLIANCE ANALYSIS REPORT ===
+Generate a comprehensive compliance analysis report based on the MCP research results.
+
+REPORT STRUCTURE:
+1. **Executive Summary** - Key compliance status and risk level
+2. **Requirements Analysis** - What the feature does
+3. **Regulatory Compliance** - Specific Utah law requirements  
+4. **Compliance Gaps** - Where requirements don't meet regulations
+5. **Recommendations** - Specific actions needed
+6. **Implementation Priority** - High/Medium/Low with timelines
+
+Make it actionable and specific to Utah Social Media Regulation Act."""
+
+MCP_TOOL_SELECTION_INSTRUCTIONS = """You are an autonomous legal compliance agent. You must decide which MCP tool to call and what query to use.
+
+=== WORKFLOW GUIDANCE ===
+1. FIRST: Use requirements_mcp to extract document requirements (if not done)
+2. THEN: Use legal_mcp to check requirements against specific jurisdictions
+3. AVOID: Repeating the same MCP tool with similar queries
+
+=== AVAILABLE TOOLS ===
+REQUIREMENTS MCP TOOLS:
+- Tool: requirements_mcp
+- For document content: Use query "document_id:UUID extract requirements"
+- For semantic search: Use query "your search terms"
+- Use ONCE per document to extract requirements
+
+LEGAL MCP TOOLS:
+- Tool: legal_mcp  
+- For compliance checking: Use query "Utah compliance [requirement type]"
+- Example: "Utah social media user data requirements"
+- Use AFTER you have requirements to check compliance
+
+=== DECISION FORMAT ===
+TOOL: [legal_mcp|requirements_mcp]
+QUERY: [your specific search query]
+REASONING: [brief 10-word reason for tool choice]
+
+IMPORTANT: If you already extracted requirements, use legal_mcp for compliance checking.
+Make your decision based on workflow progression and previous calls."""
+
+# Decision field labels (with accepted aliases) mapped to their canonical field
+_DECISION_FIELD_ALIASES = {
+    "action_type": "action_type", "next action": "action_type", "action": "action_type", "type": "action_type",
+    "reasoning": "reasoning", "reason": "reasoning", "rationale": "reasoning",
+    "response_content": "response_content", "response": "response_content", "content": "response_content",
+    "details": "details", "detail": "details"
+}
+_DECISION_LABELS = "|".join(re.escape(label) for label in sorted(_DECISION_FIELD_ALIASES, key=len, reverse=True))
+# One labelled field per match; a field's value runs until the next label line or end of text
+_DECISION_FIELD_RE = re.compile(
+    rf"^[ \t]*({_DECISION_LABELS})[ \t]*:(.*?)(?=^[ \t]*(?:{_DECISION_LABELS})[ \t]*:|\Z)",
+    re.IGNORECASE | re.MULTILINE | re.DOTALL
+)
+_DECISION_KEYWORD_RE = re.compile(r"mcp_call|legal_mcp|requirements_mcp|analysis|response")
+# Actions that need no RESPONSE_CONTENT, so decision streaming can stop once their DETAILS line is in
+_EARLY_EXIT_ACTIONS = {"mcp_call", "hitl_prompt"}
+
+# Unambiguous tool signals in a decision's DETAILS text, checked before asking the LLM
+_DOCUMENT_ID_RE = re.compile(r"(?i)\bdocument_id:\s*([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})\b")
+_LEGAL_HINT_RE = re.compile(r"(?i)\b(gdpr|ccpa|coppa|hipaa|pipeda|dsa|statute|directive|regulation|utah|eu)\b")
+_REQUIREMENTS_HINT_RE = re.compile(r"(?i)\b(?:extract|document)\s+requirements?\b")
+# Instruction wording around the search terms in DETAILS ("Use legal_mcp to search for ...")
+_DETAILS_PREAMBLE_RE = re.compile(
+    r"(?i)^(?:(?:use|call|query|ask)\s+(?:the\s+)?(?:legal|requirements)[_ ]mcp\s*(?:to|for)?\s*)?"
+    r"(?:(?:search|look\s+up|find|check|query)\s+(?:for\s+)?)?"
+)
+_DETAILS_TOOL_NAME_RE = re.compile(r"(?i)\b(?:legal|requirements)[_ ]mcp\b")
+
+# Single-pass scanner for the text-based analysis fallback: jurisdiction names (with their
+# common synonyms) and phrasing that needs LLM interpretation ("US" only upper-case, not the pronoun)
+_JURISDICTION_SYNONYMS = {
+    "utah": "Utah", "california": "California", "florida": "Florida", "brazil": "Brazil",
+    "eu": "EU", "europe": "EU", "european": "EU", "european union": "EU"
+}
+_TEXT_ANALYSIS_RE = re.compile(
+    r"\b(?P<jurisdiction>" + "|".join(sorted(map(re.escape, _JURISDICTION_SYNONYMS), key=len, reverse=True)) + r")\b"
+    r"|\b(?P<global>global(?:ly)?|worldwide|all regions)\b"
+    r"|\b(?P<ambiguous>(?-i:US)\b|(?-i:U\.S\.)|(?:usa|united states|america)\b)",
+    re.IGNORECASE
+)
+
+# JSON object inside a markdown code fence in LLM output
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+
+# Fallback scanners for the small LLM parse responses (list / risk level)
+_QUOTED_STRING_RE = re.compile(r'"([^"]+)"')
+_RISK_DIGIT_RE = re.compile(r'\b([1-5])\b')
+_RISK_WORDS = {
+    'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
+    'minimal': 1, 'low': 2, 'moderate': 3, 'high': 4, 'critical': 5
+}
+
+# Unambiguous risk statements in analysis text, checked before asking the LLM: "risk level: 4",
+# "risk score 3/5", "risk: level 2", "risk is 4/5", "high risk". A bare number after "risk" is a
+# count, not a level ("risk of 2 violations", "at risk: 3 jurisdictions")
+_RISK_STATEMENT_RE = re.compile(
+    r"\brisk[\s-]+(?:level|score|rating)\s*(?:of|is|:|=)?\s*(?P<digit>[1-5])(?:\s*/\s*5)?\b"
+    r"|\brisk\s*(?:of|is|:|=)?\s*(?:level\s+(?P<level>[1-5])\b|(?P<fraction>[1-5])\s*/\s*5\b)"
+    r"|\b(?P<word>minimal|low|moderate|high|critical)[\s-]+risk\b",
+    re.IGNORECASE
+)
+# A negation earlier in the same clause ("not a high risk", "no high risk", "isn't high risk")
+# makes a risk statement ambiguous
+_RISK_NEGATION_RE = re.compile(r"\b(?:not|no|never|without)\b|n't\b", re.IGNORECASE)
+_CLAUSE_BREAKS = ".,;:!?\n"
+
+# JSON schema for constrained decoding of the LLM-based feature analysis
+FEATURE_ANALYSIS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "compliance_required": {"type": "boolean"},
+        "risk_level": {"type": "integer"},
+        "applicable_jurisdictions": {"type": "array", "items": {"type": "string"}},
+        "requirements": {"type": "array", "items": {"type": "string"}},
+        "implementation_steps": {"type": "array", "items": {"type": "string"}},
+        "reasoning": {"type": "string"},
+        "confidence_score": {"type": "number"}
+    },
+    "required": [
+        "compliance_required", "risk_level", "applicable_jurisdictions",
+        "requirements", "implementation_steps", "reasoning", "confidence_score"
+    ]
+}
+
+# JSON schema for the combined risk level + jurisdiction parse of an analysis text
+TEXT_CLASSIFICATION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "risk_level": {"type": "integer"},
+        "jurisdictions": {"type": "array", "items": {"type": "string"}}
+    },
+    "required": ["risk_level", "jurisdictions"]
+}
+
+# Geographic answers resolved without the LLM: the clarification options we offer
+# plus the common one-word replies (compared lower-cased and stripped)
+_GLOBAL_SCOPE_ANSWERS = frozenset({
+    "global", "global (all regions)", "all", "all regions", "everywhere", "worldwide",
+    "world-wide", "globally", "international", "all countries", "all markets"
+})
+_MULTIPLE_SCOPE_ANSWERS = frozenset({
+    "multiple specific regions", "specific regions only", "specific regions", "multiple regions", "multiple"
+})
+
+# Global-scope keywords anywhere in a longer answer; only trusted without negations or named jurisdictions
+_GLOBAL_SCOPE_RE = re.compile(
+    r"\b(?:global(?:ly)?|world-?wide|everywhere|all regions|international(?:ly)?|all countries|all markets|universal)\b"
+)
+_SCOPE_NEGATION_RE = re.compile(r"\b(?:not|no|except|excluding|but)\b")
+
+# JSON schema for the single-call geographic clarification classifier
+GEOGRAPHIC_CLASSIFICATION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "is_global": {"type": "boolean"},
+        "is_multiple": {"type": "boolean"},
+        "jurisdictions": {"type": "array", "items": {"type": "string"}}
+    },
+    "required": ["is_global", "is_multiple", "jurisdictions"]
+}
+
 # Import workflow classes for autonomous operation
 class AgentAction(BaseModel):
     action_type: str  # "mcp_call", "analysis", "response", "hitl_prompt"
@@ -52,6 +426,211 @@ class AutonomousAgentState(BaseModel):
     mcp_sent_count: int = 0
     mcp_executions_for_chat: List[Dict[str, Any]] = []
     api_keys: Optional[Dict[str, str]] = None
+    version: int = 0  # Bumped on every mutation to detect concurrent changes
+    conversation_summary: str = ""  # Rolling summary of turns before conversation_summary_upto
+    conversation_summary_upto: int = 0
+    speculative_results: Dict[str, Dict[str, Any]] = {}  # tool -> {"query", "result"} pre-fetched alongside another call
+    analysis_count: int = 0  # Decisions that chose analysis, maintained by add_reasoning_step
+    evicted_steps: int = 0  # Reasoning steps dropped from the front of reasoning_steps
+    total_reasoning_time: float = 0.0  # Summed durations of evicted steps
+    
+    # Append-only rendered lines for conversation_history / tool_results, filled lazily so
+    # direct appends to the public lists are picked up on the next read
+    _conv_buf: List[str] = PrivateAttr(default_factory=list)
+    _tool_buf: List[str] = PrivateAttr(default_factory=list)
+    _joined_cache: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    
+    def add_reasoning_step(self, step: ReasoningStep):
+        """Append a reasoning step, keeping counters current and the list bounded"""
+        if step.type in ("llm_decision", "cache_hit") and "analysis" in step.content.lower():
+            self.analysis_count += 1
+        self.reasoning_steps.append(step)
+        overflow = len(self.reasoning_steps) - MAX_REASONING_STEPS
+        if overflow > 0:
+            for evicted in self.reasoning_steps[:overflow]:
+                self.total_reasoning_time += evicted.duration or 0.0
+            del self.reasoning_steps[:overflow]
+            self.evicted_steps += overflow
+    
+    def push_message(self, role: str, content: str):
+        """Append a conversation message and render its context line once"""
+        self.conversation_history.append({"role": role, "content": content})
+        self._sync_conversation()
+    
+    def push_tool(self, result: Dict[str, Any]):
+        """Append a tool result and render its context line once"""
+        self.tool_results.append(result)
+        self._sync_tools()
+    
+    def _sync_conversation(self) -> List[str]:
+        history = self.conversation_history
+        buf = self._conv_buf
+        if len(buf) > len(history):
+            # Snapshot copies share the buffer with the live state; only ever read a prefix
+            return buf[:len(history)]
+        buf.extend(f"{msg['role']}: {msg['content']}" for msg in history[len(buf):])
+        return buf
+    
+    def _sync_tools(self) -> List[str]:
+        results = self.tool_results
+        buf = self._tool_buf
+        if len(buf) > len(results):
+            return buf[:len(results)]
+        buf.extend(
+            f"Tool Result: {_compact_json(result)}"
+            for result in results[len(buf):]
+        )
+        return buf
+    
+    def joined_conversation(self, last_n: Optional[int] = None, start: int = 0) -> str:
+        """Conversation lines from start (or only the last_n) joined with newlines"""
+        lines = self._sync_conversation()
+        if last_n is not None:
+            return "\n".join(lines[-last_n:]) if last_n > 0 else ""
+        key = ("conversation", start, len(lines))
+        cached = self._joined_cache.get("conversation")
+        if cached is None or cached[0] != key:
+            cached = (key, "\n".join(lines[start:]))
+            self._joined_cache["conversation"] = cached
+        return cached[1]
+    
+    def joined_tool_results(self) -> str:
+        """All rendered tool result lines joined with newlines"""
+        lines = self._sync_tools()
+        key = ("tools", len(lines))
+        cached = self._joined_cache.get("tools")
+        if cached is None or cached[0] != key:
+            cached = (key, "\n".join(lines))
+            self._joined_cache["tools"] = cached
+        return cached[1]
+
+class LRUCache:
+    """
+    Small in-process LRU cache for LLM responses
+    Keys are content hashes built with make_key() from a normalized projection of the request
+    Entries expire after ttl seconds when a ttl is given
+    """
+    
+    def __init__(self, maxsize: int = 2048, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+    
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Hash JSON-serializable parts into a stable cache key"""
+        payload = _compact_json(parts, sort_keys=True)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+    
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def put(self, key: str, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# MCP tool that runs several tool calls in one request (used when the client lists it)
+MCP_BATCH_TOOL = "batch_execute"
+
+# How long a successful MCP tool listing is reused before it is fetched again
+TOOL_LIST_TTL_SECONDS = 60.0
+
+# Feature analyses below this confidence (the basic fallback scores 0.3) are not cached
+FEATURE_CACHE_MIN_CONFIDENCE = 0.5
+
+# Word overlap at which a speculatively pre-fetched workflow search answers a later query
+SPECULATIVE_QUERY_MIN_OVERLAP = 0.8
+
+# Field defaults for MCP results converted to JurisdictionAnalysis
+MCP_ANALYSIS_DEFAULTS = {
+    "jurisdiction": "Unknown",
+    "applicable_regulations": [],
+    "compliance_required": False,
+    "risk_level": 1,
+    "requirements": [],
+    "implementation_steps": [],
+    "confidence": 0.5,
+    "reasoning": "MCP analysis completed",
+    "analysis_time": 0.0
+}
+
+
+def _dedup(items) -> list:
+    """Order-preserving de-duplication with one hash lookup per element"""
+    seen = set()
+    return [item for item in items if not (item in seen or seen.add(item))]
+
+
+def _scan_risk_level(text: str) -> Optional[int]:
+    """
+    Risk level stated unambiguously in the text (exactly one distinct level, none of them
+    negated within its clause), else None
+    
+    >>> _scan_risk_level("Risk level: 4"), _scan_risk_level("risk is 3/5"), _scan_risk_level("a high risk feature")
+    (4, 3, 4)
+    >>> _scan_risk_level("risk of 2 violations"), _scan_risk_level("At risk: 3 jurisdictions")
+    (None, None)
+    >>> _scan_risk_level("this is not a high risk"), _scan_risk_level("high risk, also low risk")
+    (None, None)
+    """
+    levels = set()
+    for match in _RISK_STATEMENT_RE.finditer(text):
+        clause_start = max(text.rfind(mark, 0, match.start()) for mark in _CLAUSE_BREAKS) + 1
+        if _RISK_NEGATION_RE.search(text, clause_start, match.start()):
+            return None
+        digit = match.group("digit") or match.group("level") or match.group("fraction")
+        levels.add(int(digit) if digit else _RISK_WORDS[match.group("word").lower()])
+    return levels.pop() if len(levels) == 1 else None
+
+
+@lru_cache(maxsize=32)
+def _jurisdiction_names_re(names: FrozenSet[str]) -> Optional[re.Pattern]:
+    """Whole-word matcher for a set of lower-cased jurisdiction names (None for an empty set)"""
+    if not names:
+        return None
+    return re.compile(r"\b(?:" + "|".join(sorted(map(re.escape, names), key=len, reverse=True)) + r")\b")
+
+
+def _normalize_text(text: str) -> str:
+    """Case- and whitespace-insensitive projection of text for cache keys"""
+    return " ".join(str(text).lower().split())
+
+def _query_overlap(first: str, second: str) -> float:
+    """Jaccard overlap of the normalized word sets of two search queries"""
+    first_words, second_words = set(_normalize_text(first).split()), set(_normalize_text(second).split())
+    if not first_words or not second_words:
+        return 0.0
+    return len(first_words & second_words) / len(first_words | second_words)
+
+def _normalize_context(context: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Projection of a feature context for cache keys: text fields are case/whitespace-normalized
+    and string lists (geographic implications, risk indicators) become sorted sets
+    """
+    normalized = {}
+    for key, value in context.items():
+        if isinstance(value, str):
+            value = _normalize_text(value)
+        elif isinstance(value, list) and all(isinstance(item, str) for item in value):
+            value = sorted({_normalize_text(item) for item in value})
+        normalized[key] = value
+    return normalized
+
 
 class LawyerAgent:
     """
@@ -63,9 +642,13 @@ class LawyerAgent:
     
     def __init__(self, mcp_client=None):
         # Use dependency injection for easy testing and team member enhancement
-        # If mcp_client is None, create real MCP client
-        self.mcp_client = mcp_client if mcp_client is not None else RealMCPClient()
+        # If mcp_client is None, use the process-wide real MCP client
+        self.mcp_client = mcp_client if mcp_client is not None else get_shared_mcp_client()
         self.max_llm_retries = 3  # Maximum retries for LLM parsing
+        self.max_decision_retries = 2  # Retries when session state changes mid-decision
+        self.conversation_window = 8  # Turns included verbatim in prompts; older turns are summarized
+        self.max_concurrent_mcp = MCP_CONNECTIONS_PER_SERVER  # In-flight MCP tool calls per agent
+        self._mcp_slots = asyncio.Semaphore(self.max_concurrent_mcp)
         
         # Compatibility properties for endpoints that expect separate MCPs
         # These proxy to the unified mcp_client
@@ -75,9 +658,45 @@ class LawyerAgent:
         # Autonomous workflow state management
         self.active_sessions: Dict[str, AutonomousAgentState] = {}
         self.session_locks: Dict[str, asyncio.Lock] = {}
+        # Sessions with a workflow loop in progress - at most one loop drives a session
+        self._running_loops: set = set()
+        # Sessions that got a message after their running loop's last decision snapshot
+        self._queued_messages: set = set()
+        self._workflow_tasks: set = set()  # Follow-up loops for queued messages (strong refs)
         
         # HITL callback for MCP approval prompts
         self.hitl_callback: Optional[Callable] = None
+        
+        # In-flight MCP calls keyed by request hash, so identical concurrent calls share one roundtrip
+        self._inflight_mcp_calls: Dict[str, asyncio.Task] = {}
+        
+        # In-flight LLM calls keyed by request hash (single-flight for identical prompts)
+        self._inflight_llm_calls: Dict[str, asyncio.Task] = {}
+        
+        # Exact-match cache of autonomous decision responses
+        self.decision_cache = LRUCache(maxsize=2048)
+        
+        # Advice / feature analysis completions keyed by normalized query and context
+        self.completion_cache = LRUCache(maxsize=1024, ttl=24 * 3600)
+        
+        # Finished feature analyses keyed by the exact enriched context (skips MCP + LLM on repeats)
+        self.feature_cache = LRUCache(maxsize=1024, ttl=24 * 3600)
+        
+        # Small LLM parse results (jurisdictions, risk categories, risk level) keyed by prompt
+        self.parse_cache = LRUCache(maxsize=1024, ttl=24 * 3600)
+        
+        # Jurisdictions derived from the MCP tool list (refreshed every minute)
+        self.jurisdictions_cache = LRUCache(maxsize=1, ttl=60)
+        
+        # Shared MCP tool discovery: concurrent callers await one task; reused while fresh
+        self._tools_task: Optional[asyncio.Task] = None
+        self._tools_task_started = 0.0
+    
+    @staticmethod
+    def reload_prompts():
+        """Drop cached system prompt / knowledge base so the next call rereads the config files"""
+        _cached_system_prompt.cache_clear()
+        _cached_knowledge_base.cache_clear()
     
     @property
     def legal_mcp(self):
@@ -114,41 +733,63 @@ class LawyerAgent:
         else:
             raise ValueError(f"Unknown request type: {request_type}")
 
-    async def handle_user_query(self, query_data: Dict[str, Any]) -> UserQueryResponse:
+    async def handle_user_query(self, query_data: Dict[str, Any], hedge: bool = True) -> UserQueryResponse:
         """
         Handle direct user queries for legal advice
         Original requirement: "if receive user query: output advice"
         Uses MCP search for legal context, then LLM for advice generation
+        hedge: answer with a context-free draft when the search is slow - interactive queries
+        only; analyses that end up in saved reports pass False and always wait for the search
         """
-        user_query = query_data.get("query", "")
-        context = query_data.get("context", {})
-        
-        start_time = datetime.now()
+        return await self._answer_query(query_data.get("query", ""), query_data.get("context", {}), hedge)
+    
+    async def _answer_query(self, user_query: str, context: Dict[str, Any], hedge: bool = True) -> UserQueryResponse:
+        """Single MCP search + advice path shared by handle_user_query and handle_enriched_query"""
         
+        draft_task = None
         try:
             # Step 1: Search MCPs for relevant legal context (if enabled)
             legal_context_results = []
-            if self.mcp_client is not None:
+            if self.mcp_client is not None and not hedge:
+                legal_context_results = await self.mcp_client.search_for_query({"query": user_query, "context": context})
+            elif self.mcp_client is not None:
                 search_context = {"query": user_query, "context": context}
-                legal_context_results = await self.mcp_client.search_for_query(search_context)
+                mcp_task = asyncio.create_task(self.mcp_client.search_for_query(search_context))
+                
+                # Hedge a slow search with a context-free draft running alongside it
+                done, _ = await asyncio.wait({mcp_task}, timeout=settings.mcp_search_hedge_seconds)
+                if not done:
+                    draft_task = asyncio.create_task(self._fallback_user_query_response(user_query, context))
+                    remaining = max(settings.mcp_search_timeout_seconds - settings.mcp_search_hedge_seconds, 0.0)
+                    done, _ = await asyncio.wait({mcp_task}, timeout=remaining)
+                if not done:
+                    logger.warning("MCP search exceeded %.1fs, answering with the context-free draft",
+                                   settings.mcp_search_timeout_seconds)
+                    mcp_task.cancel()
+                    return await draft_task
+                
+                legal_context_results = mcp_task.result()  # Re-raises a failed search
+                if draft_task is not None:
+                    draft_task.cancel()
+                    draft_task = None
             
             # Step 2: Generate advisory response using LLM (with or without MCP context)
             advice_response = await self._generate_legal_advice(
                 user_query, context, legal_context_results
             )
             
-            end_time = datetime.now()
-            
             return UserQueryResponse(
                 advice=advice_response.get("advice", ""),
                 confidence=advice_response.get("confidence", 0.8),
                 sources=advice_response.get("sources", ["Legal knowledge base"]),
                 related_jurisdictions=advice_response.get("jurisdictions", []),
-                timestamp=end_time
+                timestamp=datetime.now(timezone.utc)
             )
             
         except Exception as e:
-            # Fallback to basic LLM response if MCP search fails
+            # Fallback to basic LLM response if MCP search fails (reusing a draft already in flight)
+            if draft_task is not None:
+                return await draft_task
             return await self._fallback_user_query_response(user_query, context)
     
     async def handle_enriched_query(self, enriched_context: Dict[str, Any]) -> UserQueryResponse:
@@ -157,73 +798,151 @@ class LawyerAgent:
         Uses enriched context for better legal analysis
         """
         
-        # Extract original query information from enriched context
-        query_info = {
-            "query": enriched_context.get("expanded_description", ""),
-            "context": {
+        # Answer straight from the enriched fields - no query_data dict to rebuild and re-parse
+        return await self._answer_query(
+            enriched_context.get("expanded_description", ""),
+            {
                 "geographic_implications": enriched_context.get("geographic_implications", []),
                 "risk_indicators": enriched_context.get("risk_indicators", []),
                 "feature_category": enriched_context.get("feature_category", "")
             }
-        }
+        )
+
+    async def stream_user_query(self, query_data: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming variant of handle_user_query
+        Yields {"type": "token", "content"} events as the advice is generated, then one
+        {"type": "complete", ...} event carrying the same fields as UserQueryResponse
+        """
+        user_query = query_data.get("query", "")
+        context = query_data.get("context", {})
         
-        # Process as enhanced user query with enriched context
-        return await self.handle_user_query(query_info)
+        legal_context_results = []
+        if self.mcp_client is not None:
+            # Same search budget as handle_user_query - a stalled search must not hold back the first token
+            try:
+                search_context = {"query": user_query, "context": context}
+                legal_context_results = await asyncio.wait_for(
+                    self.mcp_client.search_for_query(search_context),
+                    timeout=settings.mcp_search_timeout_seconds
+                )
+            except asyncio.TimeoutError:
+                logger.warning("MCP search exceeded %.1fs for streamed query, continuing without legal context",
+                               settings.mcp_search_timeout_seconds)
+            except Exception as e:
+                logger.warning("MCP search failed for streamed query, continuing without legal context: %s", e)
+        
+        request = self._build_advice_request(user_query, context, legal_context_results)
+        advice = self.completion_cache.get(request["cache_key"])
+        
+        if advice is None:
+            chunks = []
+            async for chunk in llm_client.stream(
+                request["prompt"],
+                max_tokens=settings.llm_max_tokens_advice,
+                temperature=0.2,
+                system=request["system"]
+            ):
+                if chunk.get("content"):
+                    chunks.append(chunk["content"])
+                    yield {"type": "token", "content": chunk["content"]}
+                elif chunk.get("done"):
+                    break
+            advice = self._advice_result(request, "".join(chunks))
+            if chunks:
+                self.completion_cache.put(request["cache_key"], advice)
+        else:
+            yield {"type": "token", "content": advice["advice"]}
+        
+        yield {
+            "type": "complete",
+            "advice": advice["advice"],
+            "confidence": advice["confidence"],
+            "sources": advice["sources"],
+            "related_jurisdictions": advice["jurisdictions"],
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
 
-    async def _generate_legal_advice(self, query: str, context: Dict, legal_context: List[Dict]) -> Dict[str, Any]:
-        """Generate legal advice using MCP search results and LLM"""
+    def _build_advice_request(self, query: str, context: Dict, legal_context: List[Dict]) -> Dict[str, Any]:
+        """Prompt, system prefix, cache key and citation metadata for an advice completion"""
         
-        # Compile legal context from MCP search results
-        context_text = ""
-        sources = []
-        jurisdictions = []
+        # Compile legal context from MCP search results (joined once; citations de-duplicated in order),
+        # in ranking order up to the prompt budget - only results that made it in are cited
+        context_parts = []
+        sources = {}
+        jurisdictions = {}
+        budget = settings.llm_legal_context_max_chars
         
         for result in legal_context:
             if result and result.get("results"):
                 jurisdiction = result.get("jurisdiction", "Unknown")
-                jurisdictions.append(jurisdiction)
                 
                 for search_result in result["results"]:
-                    context_text += f"\n{jurisdiction}: {search_result.get('content', '')}"
+                    if budget <= 0:
+                        break
+                    part = f"\n{jurisdiction}: {search_result.get('content', '')}"
+                    if len(part) > budget:
+                        part = part[:budget]
+                    context_parts.append(part)
+                    budget -= len(part)
+                    jurisdictions[jurisdiction] = None
                     if search_result.get('source_document'):
-                        sources.append(f"{jurisdiction} - {search_result['source_document']}")
+                        sources[f"{jurisdiction} - {search_result['source_document']}"] = None
+        
+        context_text = "".join(context_parts)
+        sources = list(sources)
+        jurisdictions = list(jurisdictions)
         
         # Use ONLY the configurable system prompt
-        system_prompt = get_system_prompt()
-        knowledge_base = get_knowledge_base()
+        system_prompt = _cached_system_prompt()
+        knowledge_base = _cached_knowledge_base()
         
-        # Generate advice prompt with or without MCP legal context
+        # Static prefix first (provider prefix cache); per-query fields only in the prompt
+        advice_parts = [f"User Query: {query}", f"Additional Context: {_compact_json(context, sort_keys=True)}"]
         if context_text:
-            advice_prompt = f"""{system_prompt}
-
-User Query: {query}
-Additional Context: {context}
-
-Relevant Legal Context:
-{context_text}
-
-Knowledge Base:
-{knowledge_base}
-"""
-        else:
-            advice_prompt = f"""{system_prompt}
-
-User Query: {query}
-Additional Context: {context}
+            advice_parts += ["", "Relevant Legal Context:", context_text]
+        
+        return {
+            "prompt": "\n".join(advice_parts),
+            "system": _knowledge_system(system_prompt, knowledge_base),
+            "cache_key": LRUCache.make_key(
+                "legal_advice", _normalize_text(query), context, context_text,
+                sorted(sources), sorted(jurisdictions), system_prompt, knowledge_base
+            ),
+            "has_legal_context": bool(context_text),
+            "sources": sources,
+            "jurisdictions": jurisdictions
+        }
+    
+    @staticmethod
+    def _advice_result(request: Dict[str, Any], content: str) -> Dict[str, Any]:
+        return {
+            "advice": content or "Unable to generate specific advice.",
+            "confidence": 0.85 if request["has_legal_context"] else 0.6,
+            "sources": request["sources"] or ["Legal knowledge base"],
+            "jurisdictions": request["jurisdictions"]
+        }
 
-Knowledge Base:
-{knowledge_base}
-"""
+    async def _generate_legal_advice(self, query: str, context: Dict, legal_context: List[Dict]) -> Dict[str, Any]:
+        """Generate legal advice using MCP search results and LLM"""
+        
+        request = self._build_advice_request(query, context, legal_context)
+        cached_advice = self.completion_cache.get(request["cache_key"])
+        if cached_advice is not None:
+            return dict(cached_advice)
         
         try:
-            response = await llm_client.complete(advice_prompt, max_tokens=800, temperature=0.2)
+            response = await self._complete_coalesced(
+                request["prompt"],
+                max_tokens=settings.llm_max_tokens_advice,
+                temperature=0.2,
+                system=request["system"]
+            )
             
-            return {
-                "advice": response.get("content", "Unable to generate specific advice."),
-                "confidence": 0.85 if context_text else 0.6,
-                "sources": list(set(sources)) if sources else ["Legal knowledge base"],
-                "jurisdictions": list(set(jurisdictions))
-            }
+            advice = self._advice_result(request, response.get("content", ""))
+            if response.get("content"):
+                self.completion_cache.put(request["cache_key"], advice)
+            return dict(advice)
             
         except Exception as e:
             return {
@@ -239,26 +958,24 @@ Knowledge Base:
         try:
             # Basic LLM response without MCP context
             # Use ONLY the configurable system prompt
-            system_prompt = get_system_prompt()
-            knowledge_base = get_knowledge_base()
+            system_prompt = _cached_system_prompt()
+            knowledge_base = _cached_knowledge_base()
             
-            fallback_prompt = f"""{system_prompt}
-
-User Query: {query}
-Context: {context}
-
-Knowledge Base:
-{knowledge_base}
-"""
-            
-            response = await llm_client.complete(fallback_prompt, max_tokens=600, temperature=0.2)
+            cache_key = LRUCache.make_key(
+                "fallback_advice", _normalize_text(query), context, system_prompt, knowledge_base
+            )
+            advice = self.completion_cache.get(cache_key)
+            if advice is None:
+                advice = await self._complete_fallback_advice(query, context, system_prompt, knowledge_base)
+                if advice:
+                    self.completion_cache.put(cache_key, advice)
             
             return UserQueryResponse(
-                advice=response.get("content", "Unable to provide guidance at this time."),
+                advice=advice or "Unable to provide guidance at this time.",
                 confidence=0.5,
                 sources=["General legal knowledge"],
                 related_jurisdictions=["General"],
-                timestamp=datetime.now()
+                timestamp=datetime.now(timezone.utc)
             )
             
         except Exception:
@@ -267,8 +984,23 @@ Knowledge Base:
                 confidence=0.1,
                 sources=["System Error"],
                 related_jurisdictions=[],
-                timestamp=datetime.now()
+                timestamp=datetime.now(timezone.utc)
             )
+    
+    async def _complete_fallback_advice(self, query: str, context: Dict, system_prompt: str, knowledge_base: str) -> str:
+        """LLM advice without MCP context for _fallback_user_query_response"""
+        
+        fallback_prompt = f"""User Query: {query}
+Context: {_compact_json(context, sort_keys=True)}"""
+        
+        response = await self._complete_coalesced(
+            fallback_prompt,
+            max_tokens=settings.llm_max_tokens_fallback_advice,
+            temperature=0.2,
+            system=_knowledge_system(system_prompt, knowledge_base),
+            tier="fast"
+        )
+        return response.get("content", "")
 
     async def analyze(self, enriched_context: Dict[str, Any], user_interaction_callback=None) -> FeatureAnalysisResponse:
         """
@@ -277,9 +1009,27 @@ Knowledge Base:
         Supports interactive clarification for ambiguous features
         """
         
-        start_time = datetime.now()
+        start_perf = time.perf_counter_ns()
         feature_id = str(uuid.uuid4())
         
+        # Interactive runs depend on the user's answers, so only non-interactive ones are cached;
+        # the key ignores case, whitespace and list order so resubmitted features hit too, and
+        # covers the prompt / knowledge base so reload_prompts() retires stale analyses
+        cache_key = None
+        if user_interaction_callback is None:
+            cache_key = LRUCache.make_key(
+                "feature", _normalize_context(enriched_context),
+                LRUCache.make_key(_cached_system_prompt(), _cached_knowledge_base())
+            )
+            cached = self.feature_cache.get(cache_key)
+            if cached is not None:
+                return cached.model_copy(update={
+                    "feature_id": feature_id,
+                    "feature_name": enriched_context.get("original_feature", "Unknown Feature"),
+                    "analysis_time": 0.0,
+                    "created_at": datetime.now(timezone.utc)
+                })
+        
         # Use reasoning-based MCP orchestration if MCP client available
         if self.mcp_client is not None:
             jurisdiction_analyses = await self._analyze_with_interactive_reasoning(
@@ -293,9 +1043,13 @@ Knowledge Base:
             enriched_context,
             jurisdiction_analyses,
             feature_id,
-            start_time
+            start_perf
         )
         
+        # The basic fallback (analysis failed) is not cached so a retry gets a real analysis
+        if cache_key is not None and final_decision.confidence_score >= FEATURE_CACHE_MIN_CONFIDENCE:
+            self.feature_cache.put(cache_key, final_decision)
+        
         return final_decision
     
     async def _analyze_with_interactive_reasoning(self, enriched_context: Dict[str, Any], user_callback=None) -> List[JurisdictionAnalysis]:
@@ -322,21 +1076,19 @@ Knowledge Base:
         geographic_implications = enriched_context.get("geographic_implications", [])
         feature_description = enriched_context.get("expanded_description", "")
         
-        # Get available jurisdictions dynamically from MCP client
+        # Get available jurisdictions dynamically from MCP client (also the clarification options)
         available_jurisdictions = await self._get_available_jurisdictions()
-        known_jurisdiction_names = [j.lower() for j in available_jurisdictions] if available_jurisdictions else []
         
-        is_ambiguous = (
-            not geographic_implications or  # Empty geographic implications
-            geographic_implications == ["US"] or  # Generic US
-            len(feature_description) < 50 or  # Very short description
-            not any(geo.lower() in known_jurisdiction_names for geo in geographic_implications) if known_jurisdiction_names else True  # No recognized jurisdictions
-        )
+        # Cheap checks first; set lookup for recognised jurisdictions
+        if not geographic_implications or geographic_implications == ["US"] or len(feature_description) < 50:
+            is_ambiguous = True
+        else:
+            known_jurisdiction_names = {j.lower() for j in available_jurisdictions}
+            is_ambiguous = not known_jurisdiction_names or not any(
+                geo.lower() in known_jurisdiction_names for geo in geographic_implications
+            )
         
         if is_ambiguous:
-            # Get available jurisdictions for options
-            available_jurisdictions = await self._get_available_jurisdictions()
-            
             # Create dynamic options
             dynamic_options = ["Global (all regions)"]
             if available_jurisdictions:
@@ -344,14 +1096,15 @@ Knowledge Base:
             dynamic_options.append("Multiple specific regions")
             
             # Ask for geographic clarification
+            feature_name = enriched_context.get("original_feature", "Unknown")
             clarification_question = {
                 "type": "geographic_scope",
-                "question": f"The geographic scope for feature '{enriched_context.get('original_feature', 'Unknown')}' is unclear. Is this feature being deployed globally or to specific regions?",
+                "question": f"The geographic scope for feature '{feature_name}' is unclear. Is this feature being deployed globally or to specific regions?",
                 "options": dynamic_options,
                 "available_jurisdictions": available_jurisdictions,
                 "context": {
-                    "feature": enriched_context.get("original_feature", "Unknown"),
-                    "description": enriched_context.get("expanded_description", "")[:200] + "..." if len(enriched_context.get("expanded_description", "")) > 200 else enriched_context.get("expanded_description", ""),
+                    "feature": feature_name,
+                    "description": feature_description[:200] + "..." if len(feature_description) > 200 else feature_description,
                     "current_geographic_implications": geographic_implications
                 }
             }
@@ -361,54 +1114,52 @@ Knowledge Base:
             
             # Update enriched context with user clarification
             enriched_context = await self._incorporate_geographic_clarification(
-                enriched_context, user_response, user_callback
+                enriched_context, user_response, user_callback, available_jurisdictions
             )
         
         return enriched_context
     
-    async def _incorporate_geographic_clarification(self, enriched_context: Dict[str, Any], user_response: str, user_callback) -> Dict[str, Any]:
+    async def _incorporate_geographic_clarification(self, enriched_context: Dict[str, Any], user_response: str, user_callback, available_jurisdictions: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Incorporate user's geographic clarification into enriched context
         Handles follow-up questions for unclear responses
+        available_jurisdictions: list the caller already fetched (looked up once otherwise)
         """
         
         new_geographic_implications = []
         
         # Use LLM to intelligently parse the response
-        available_jurisdictions = await self._get_available_jurisdictions()
+        if available_jurisdictions is None:
+            available_jurisdictions = await self._get_available_jurisdictions()
         if not available_jurisdictions:
             available_jurisdictions = ["Utah", "EU", "California", "Florida", "Brazil"]
-            
-        # Check if this is a global deployment request
-        is_global = await self._is_global_deployment_request(user_response)
-        if is_global:
-            new_geographic_implications = available_jurisdictions
-            
-        elif await self._is_multiple_regions_request(user_response):
-            # Ask follow-up for specific regions
-            available_jurisdictions = await self._get_available_jurisdictions()
-            followup_question = {
-                "type": "specific_regions",
-                "question": "Which specific regions will this feature be deployed to? (Select all that apply)",
-                "options": available_jurisdictions,
-                "available_jurisdictions": available_jurisdictions,
-                "multiple_select": True,
-                "context": {"previous_response": user_response}
-            }
-            
-            specific_regions = await user_callback(followup_question)
-            new_geographic_implications = await self._parse_multiple_regions(specific_regions)
-            
-        else:
-            # First try to parse response against available jurisdictions
-            parsed_jurisdictions = await self._parse_jurisdiction_response(
-                user_response, await self._get_available_jurisdictions()
-            )
-            
-            if parsed_jurisdictions:
-                new_geographic_implications = parsed_jurisdictions
+        
+        # Re-ask until the scope is clear (iteratively - no frame per unclear answer)
+        while True:
+            # One classification call answers global / multiple / which jurisdictions
+            classification = await self._classify_geographic_response(user_response, available_jurisdictions)
+            if classification["is_global"]:
+                new_geographic_implications = available_jurisdictions
+                
+            elif classification["is_multiple"] and not classification["jurisdictions"]:
+                # Ask follow-up for specific regions
+                followup_question = {
+                    "type": "specific_regions",
+                    "question": "Which specific regions will this feature be deployed to? (Select all that apply)",
+                    "options": available_jurisdictions,
+                    "available_jurisdictions": available_jurisdictions,
+                    "multiple_select": True,
+                    "context": {"previous_response": user_response}
+                }
+                
+                specific_regions = await user_callback(followup_question)
+                new_geographic_implications = await self._parse_multiple_regions(specific_regions, available_jurisdictions)
+                
+            elif classification["jurisdictions"]:
+                new_geographic_implications = classification["jurisdictions"]
+                
             else:
-                # Unclear response - ask follow-up
+                # Unclear response - ask follow-up and classify the clarified answer
                 followup_question = {
                     "type": "clarify_response",
                     "question": f"I didn't understand '{user_response}'. Could you clarify: Is this feature for all regions globally, or specific regions only?",
@@ -416,11 +1167,10 @@ Knowledge Base:
                     "context": {"unclear_response": user_response}
                 }
                 
-                clarified_response = await user_callback(followup_question)
-                # Recursively handle the clarified response
-                return await self._incorporate_geographic_clarification(
-                    enriched_context, clarified_response, user_callback
-                )
+                user_response = await user_callback(followup_question)
+                continue
+            
+            break
         
         # Update enriched context
         updated_context = enriched_context.copy()
@@ -429,18 +1179,37 @@ Knowledge Base:
         
         return updated_context
     
-    async def _parse_multiple_regions(self, regions_response: str) -> List[str]:
+    async def _parse_multiple_regions(self, regions_response: str, available_jurisdictions: Optional[List[str]] = None) -> List[str]:
         """
         Parse user's multiple regions selection
         """
-        # Parse against available jurisdictions dynamically
-        available_jurisdictions = await self._get_available_jurisdictions()
+        # Parse against available jurisdictions dynamically (unless the caller passed them)
+        if available_jurisdictions is None:
+            available_jurisdictions = await self._get_available_jurisdictions()
         if not available_jurisdictions:
             available_jurisdictions = ["Utah", "EU", "California", "Florida", "Brazil"]
         regions = await self._parse_jurisdiction_response(regions_response, available_jurisdictions)
         
         return regions if regions else (available_jurisdictions[:1] if available_jurisdictions else [])  # First available jurisdiction as fallback
     
+    async def _list_mcp_tools(self) -> List[Dict[str, Any]]:
+        """
+        mcp_client.list_available_tools() shared by every concurrent caller
+        A successful listing is reused for TOOL_LIST_TTL_SECONDS; a failed one is retried
+        """
+        task = self._tools_task
+        stale = task is not None and task.done() and (
+            task.cancelled() or task.exception() is not None
+            or time.monotonic() - self._tools_task_started >= TOOL_LIST_TTL_SECONDS
+        )
+        if task is None or stale:
+            task = asyncio.create_task(self.mcp_client.list_available_tools())
+            self._tools_task = task
+            self._tools_task_started = time.monotonic()
+        
+        # Shield so one cancelled caller doesn't cancel the listing for the others
+        return await asyncio.shield(task)
+    
     async def _get_available_jurisdictions(self) -> List[str]:
         """
         Get list of available jurisdictions from MCP client dynamically
@@ -449,18 +1218,20 @@ Knowledge Base:
         if not self.mcp_client:
             return []
         
+        # The tool list changes on the order of minutes - reuse it across calls
+        jurisdictions = self.jurisdictions_cache.get("jurisdictions")
+        if jurisdictions is not None:
+            return list(jurisdictions)
+        
         try:
             # Get available MCP tools
-            available_tools = await self.mcp_client.list_available_tools()
+            available_tools = await self._list_mcp_tools()
             
             # Extract jurisdiction names from tool descriptions
-            jurisdictions = []
-            for tool in available_tools:
-                jurisdiction = tool.get("jurisdiction")
-                if jurisdiction and jurisdiction not in jurisdictions:
-                    jurisdictions.append(jurisdiction)
+            jurisdictions = _dedup(tool.get("jurisdiction") for tool in available_tools if tool.get("jurisdiction"))
+            self.jurisdictions_cache.put("jurisdictions", jurisdictions)
             
-            return jurisdictions
+            return list(jurisdictions)
             
         except Exception:
             # Fallback to empty list - let LLM handle the situation
@@ -482,22 +1253,27 @@ Knowledge Base:
         Agent discovers available MCPs and decides which to call based on legal analysis needs
         """
         
+        # Discover available MCP tools
+        try:
+            available_tools = await self._list_mcp_tools()
+        except Exception as e:
+            # Fallback to old method if tool discovery not implemented
+            logger.warning("MCP tool discovery failed, using fallback: %s", e)
+            return await self.mcp_client.analyze_parallel(enriched_context)
+        
+        if not available_tools:
+            # Nothing the reasoning step could call - skip it (synthesis falls back to the LLM)
+            return []
+        
         analysis_state = {
             "context": enriched_context,
             "mcp_results": [],
             "reasoning_log": [],
             "iteration": 0,
-            "available_tools": None
+            "available_tools": available_tools,
+            "completed_calls": set()  # (tool, focus) pairs already answered for the current context
         }
         
-        # Discover available MCP tools
-        try:
-            analysis_state["available_tools"] = await self.mcp_client.list_available_tools()
-        except Exception as e:
-            # Fallback to old method if tool discovery not implemented
-            print(f"MCP tool discovery failed, using fallback: {e}")
-            return await self.mcp_client.analyze_parallel(enriched_context)
-        
         # Iterative reasoning loop
         max_iterations = 5
         while analysis_state["iteration"] < max_iterations:
@@ -513,25 +1289,36 @@ Knowledge Base:
                         analysis_state = await self._handle_mid_analysis_clarification(
                             analysis_state, reasoning_decision, clarification_response
                         )
+                        # The context changed, so earlier calls may now return something new
+                        analysis_state["completed_calls"].clear()
                     else:
                         # No callback available - this should not happen per requirements
                         # But handle gracefully with best guess
                         reasoning_decision = await self._fallback_reasoning_decision(reasoning_decision)
                         
-                elif reasoning_decision.get("action") == "call_mcp":
-                    # Call specific MCP with targeted query
-                    mcp_result = await self._call_specific_mcp(
-                        reasoning_decision.get("mcp_tool_name"),
-                        reasoning_decision.get("query_focus"),
-                        enriched_context
-                    )
+                elif reasoning_decision.get("action") in ("call_mcps", "call_mcp"):
+                    # Independent tool calls go out concurrently - one round-trip per batch;
+                    # calls answered in an earlier iteration are not repeated
+                    completed_calls = analysis_state["completed_calls"]
+                    calls = [
+                        call for call in self._planned_mcp_calls(reasoning_decision)
+                        if (call["mcp_tool_name"], call.get("query_focus")) not in completed_calls
+                    ]
+                    if not calls:
+                        # Only repeats were planned - nothing new to gather
+                        break
+                    outcomes = await self._call_all_mcps(calls, enriched_context)
                     
-                    analysis_state["mcp_results"].append(mcp_result)
-                    analysis_state["reasoning_log"].append({
-                        "iteration": analysis_state["iteration"],
-                        "decision": reasoning_decision,
-                        "result_summary": mcp_result.get("jurisdiction", "Unknown") if mcp_result else "Failed"
-                    })
+                    # Error results are kept; _convert_mcp_results_to_analyses skips them
+                    analysis_state["mcp_results"].extend(outcomes)
+                    for call, mcp_result in zip(calls, outcomes):
+                        if "error" not in mcp_result:
+                            completed_calls.add((call["mcp_tool_name"], call.get("query_focus")))
+                        analysis_state["reasoning_log"].append({
+                            "iteration": analysis_state["iteration"],
+                            "decision": {**reasoning_decision, **call},
+                            "result_summary": "Failed" if "error" in mcp_result else mcp_result.get("jurisdiction", "Unknown")
+                        })
                     
                 elif reasoning_decision.get("action") == "finalize":
                     # LLM believes it has sufficient information
@@ -547,13 +1334,30 @@ Knowledge Base:
                     
                 analysis_state["iteration"] += 1
                 
-            except Exception as e:
-                print(f"Reasoning iteration {analysis_state['iteration']} failed: {e}")
+            except Exception:
+                logger.exception("Reasoning iteration %s failed", analysis_state['iteration'])
                 break
         
         # Convert MCP results to JurisdictionAnalysis objects
         return self._convert_mcp_results_to_analyses(analysis_state["mcp_results"])
     
+    @staticmethod
+    def _planned_mcp_calls(reasoning_decision: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Tool calls from a call_mcps decision (single call_mcp decisions become one call)"""
+        calls = reasoning_decision.get("calls")
+        if not isinstance(calls, list):
+            calls = [reasoning_decision]
+        
+        # Drop malformed entries and repeats of the same tool/focus pair
+        planned = {}
+        for call in calls:
+            if isinstance(call, dict) and call.get("mcp_tool_name"):
+                planned.setdefault((call["mcp_tool_name"], call.get("query_focus")), {
+                    "mcp_tool_name": call["mcp_tool_name"],
+                    "query_focus": call.get("query_focus")
+                })
+        return list(planned.values())
+    
     async def _reason_about_next_action(self, analysis_state: Dict[str, Any]) -> Dict[str, Any]:
         """
         LLM reasoning to decide which MCP tool to call next
@@ -565,23 +1369,21 @@ Knowledge Base:
         previous_results = analysis_state["mcp_results"]
         
         # Format available tools for LLM
-        tools_description = "\n".join([
+        tools_description = "\n".join(
             f"- {tool.get('name', 'unknown')}: {tool.get('description', 'No description')} (Jurisdiction: {tool.get('jurisdiction', 'Unknown')})" 
             for tool in available_tools
-        ])
+        )
         
         # Format previous results
-        previous_calls = "\n".join([
+        previous_calls = "\n".join(
             f"- Called {result.get('jurisdiction', 'Unknown')}: {result.get('reasoning', 'No reasoning provided')[:100]}..."
             for result in previous_results
-        ])
+        )
         
         # Use ONLY the configurable system prompt
-        system_prompt = get_system_prompt()
+        system_prompt = _cached_system_prompt()
         
-        reasoning_prompt = f"""{system_prompt}
-
-Analyzing uploaded document compliance. Decide next action.
+        reasoning_prompt = f"""Analyzing uploaded document compliance. Decide next action.
 
 Feature Context:
 - Feature: {context.get('original_feature', 'Unknown')}
@@ -594,46 +1396,33 @@ Available Tools:
 {tools_description or "None"}
 
 Previous Calls:
-{previous_calls or "None"}
-
-Decide:
-- "call_mcp": Need more information from tool
-- "finalize": Have sufficient information
-
-JSON format:
-{{
-    "action": "call_mcp" or "finalize",
-    "mcp_tool_name": "exact_tool_name_from_list",
-    "query_focus": "specific legal question",
-    "reasoning": "brief reason"
-}}"""
+{previous_calls or "None"}"""
         
         try:
-            response = await llm_client.complete(reasoning_prompt, max_tokens=400, temperature=0.2)
+            response = await llm_client.complete(
+                reasoning_prompt,
+                max_tokens=400,
+                temperature=0.2,
+                system=_instruction_system(system_prompt, MCP_REASONING_INSTRUCTIONS)
+            )
             content = response.get("content", "")
             
-            # Parse JSON response
-            
-            # Extract JSON from markdown code blocks if present
-            json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                json_str = content.strip()
-            
-            reasoning_decision = json.loads(json_str)
+            # Parse JSON response (fenced or bare)
+            reasoning_decision = _parse_llm_json(content)
             return reasoning_decision
             
         except Exception as e:
             # Fallback decision if LLM reasoning fails
-            print(f"LLM reasoning failed: {e}")
+            logger.warning("LLM reasoning failed: %s", e)
             
             # Simple fallback: call first available tool if none called yet
             if not previous_results and available_tools:
                 return {
-                    "action": "call_mcp",
-                    "mcp_tool_name": available_tools[0].get("name", "unknown"),
-                    "query_focus": "general compliance analysis",
+                    "action": "call_mcps",
+                    "calls": [{
+                        "mcp_tool_name": available_tools[0].get("name", "unknown"),
+                        "query_focus": "general compliance analysis"
+                    }],
                     "reasoning": "Fallback decision due to LLM reasoning failure"
                 }
             else:
@@ -712,27 +1501,111 @@ JSON format:
             "reasoning": "User interaction unavailable, cannot clarify ambiguous feature"
         }
     
+    async def _call_all_mcps(self, calls: List[Dict[str, Any]], context: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Run independent MCP tool calls concurrently (latency = slowest call, not the sum)
+        Results come back in call order; failures become {"error": ...} dicts
+        """
+        if len(calls) > 1 and await self._mcp_supports_batch():
+            batched = await self._call_mcps_batched(calls, context)
+            if batched is not None:
+                return batched
+        
+        outcomes = await asyncio.gather(
+            *(self._call_specific_mcp(call.get("mcp_tool_name"), call.get("query_focus"), context) for call in calls),
+            return_exceptions=True
+        )
+        
+        results = []
+        for call, outcome in zip(calls, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.warning("MCP call %s failed: %s", call.get("mcp_tool_name"), outcome,
+                               extra={"tool_name": call.get("mcp_tool_name")})
+                outcome = {"error": f"MCP call failed: {outcome}", "tool_name": call.get("mcp_tool_name")}
+            results.append(outcome or {"error": "Empty MCP result", "tool_name": call.get("mcp_tool_name")})
+        return results
+    
+    async def _mcp_supports_batch(self) -> bool:
+        """Whether the MCP client advertises the batch_execute tool"""
+        try:
+            tools = await self._list_mcp_tools()
+        except Exception:
+            return False
+        return any(tool.get("name") == MCP_BATCH_TOOL for tool in tools)
+    
+    async def _call_mcps_batched(self, calls: List[Dict[str, Any]], context: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Send every tool call in one batch_execute request, with the feature context carried once
+        Returns None if the batch request itself fails (caller dispatches the calls individually)
+        """
+        try:
+            async with self._mcp_slots:
+                response = await self.mcp_client.call_tool(
+                    name=MCP_BATCH_TOOL,
+                    arguments={
+                        "shared_arguments": {"feature_context": context},
+                        "operations": [
+                            {"tool": call.get("mcp_tool_name"), "arguments": {"analysis_focus": call.get("query_focus")}}
+                            for call in calls
+                        ],
+                        "maxConcurrent": self.max_concurrent_mcp,
+                        "stopOnError": False
+                    }
+                )
+        except Exception as e:
+            logger.warning("MCP batch_execute failed, dispatching calls individually: %s", e)
+            return None
+        
+        results = response.get("results") if isinstance(response, dict) else None
+        if not isinstance(results, list) or len(results) != len(calls):
+            logger.warning("Malformed MCP batch_execute response, dispatching calls individually")
+            return None
+        
+        return [
+            result if isinstance(result, dict) and result else {"error": "Empty MCP result", "tool_name": call.get("mcp_tool_name")}
+            for call, result in zip(calls, results)
+        ]
+    
     async def _call_specific_mcp(self, mcp_tool_name: str, query_focus: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Call specific MCP tool with targeted query using proper MCP protocol
+        Identical concurrent calls are coalesced onto a single in-flight request
         """
         
         if not mcp_tool_name:
             return {"error": "No MCP tool name provided"}
         
+        key = hashlib.blake2b(
+            f"{mcp_tool_name}|{query_focus}|{_compact_json(context, sort_keys=True)}".encode(),
+            digest_size=16
+        ).hexdigest()
+        
+        task = self._inflight_mcp_calls.get(key)
+        if task is None:
+            task = asyncio.create_task(self._invoke_mcp_tool(mcp_tool_name, query_focus, context))
+            self._inflight_mcp_calls[key] = task
+            task.add_done_callback(lambda _: self._inflight_mcp_calls.pop(key, None))
+        
+        # Shield so one cancelled waiter doesn't cancel the call for the others
+        return await asyncio.shield(task)
+    
+    async def _invoke_mcp_tool(self, mcp_tool_name: str, query_focus: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Perform the actual MCP tool call for _call_specific_mcp"""
+        
         try:
-            # Standard MCP tool calling
-            result = await self.mcp_client.call_tool(
-                name=mcp_tool_name,
-                arguments={
-                    "feature_context": context,
-                    "analysis_focus": query_focus
-                }
-            )
+            # Standard MCP tool calling, within the agent's concurrency budget
+            async with self._mcp_slots:
+                result = await self.mcp_client.call_tool(
+                    name=mcp_tool_name,
+                    arguments={
+                        "feature_context": context,
+                        "analysis_focus": query_focus
+                    }
+                )
             return result
             
         except Exception as e:
-            print(f"MCP tool call failed for {mcp_tool_name}: {e}")
+            logger.exception("MCP tool call failed for %s", mcp_tool_name, extra={"tool_name": mcp_tool_name})
             return {
                 "error": f"MCP call failed: {str(e)}",
                 "jurisdiction": "Unknown",
@@ -751,22 +1624,12 @@ JSON format:
                 continue
                 
             try:
-                # Convert MCP result to JurisdictionAnalysis format
-                analysis = JurisdictionAnalysis(
-                    jurisdiction=result.get("jurisdiction", "Unknown"),
-                    applicable_regulations=result.get("applicable_regulations", []),
-                    compliance_required=result.get("compliance_required", False),
-                    risk_level=result.get("risk_level", 1),
-                    requirements=result.get("requirements", []),
-                    implementation_steps=result.get("implementation_steps", []),
-                    confidence=result.get("confidence", 0.5),
-                    reasoning=result.get("reasoning", "MCP analysis completed"),
-                    analysis_time=result.get("analysis_time", 0.0)
-                )
-                analyses.append(analysis)
+                # Convert MCP result to JurisdictionAnalysis format (missing fields take the defaults,
+                # unknown keys are ignored by the model)
+                analyses.append(JurisdictionAnalysis.model_validate({**MCP_ANALYSIS_DEFAULTS, **result}))
                 
             except Exception as e:
-                print(f"Failed to convert MCP result to JurisdictionAnalysis: {e}")
+                logger.warning("Failed to convert MCP result to JurisdictionAnalysis: %s", e)
                 continue
         
         return analyses
@@ -776,7 +1639,7 @@ JSON format:
         context: Dict[str, Any], 
         analyses: List[JurisdictionAnalysis],
         feature_id: str,
-        start_time: datetime
+        start_perf: int
     ) -> FeatureAnalysisResponse:
         """
         Synthesize jurisdiction analyses into unified decision
@@ -785,52 +1648,49 @@ JSON format:
         
         if not analyses:
             # Use LLM-based analysis when MCP is disabled
-            return await self._create_llm_based_fallback(context, feature_id, start_time)
-        
-        # Determine overall compliance requirement
-        # Rule: If ANY jurisdiction requires compliance, overall compliance is required
-        compliance_required = any(analysis.compliance_required for analysis in analyses)
-        
-        # Calculate overall risk level
-        # Rule: Use maximum risk level across jurisdictions
-        risk_levels = [analysis.risk_level for analysis in analyses if analysis.risk_level > 0]
-        overall_risk_level = max(risk_levels) if risk_levels else 1
-        
-        # Identify applicable jurisdictions
-        applicable_jurisdictions = [
-            analysis.jurisdiction 
-            for analysis in analyses 
-            if analysis.compliance_required
-        ]
-        
-        # Aggregate requirements and implementation steps
-        all_requirements = []
-        all_implementation_steps = []
+            return await self._create_llm_based_fallback(context, feature_id, start_perf)
+        
+        # Single pass over the jurisdiction analyses:
+        # - compliance is required if ANY jurisdiction requires it
+        # - risk level is the maximum (positive) risk level across jurisdictions
+        # - confidence is the mean of the positive confidence scores
+        # - applicable jurisdictions / requirements / steps come from compliance-requiring
+        #   jurisdictions, de-duplicated as we go (order preserved)
+        compliance_required = False
+        overall_risk_level = 0
+        confidence_sum, confidence_count = 0.0, 0
+        applicable_jurisdictions, requirements, implementation_steps = [], [], []
+        seen_jurisdictions, seen_requirements, seen_steps = set(), set(), set()
         
         for analysis in analyses:
-            if analysis.compliance_required:
-                all_requirements.extend(analysis.requirements)
-                all_implementation_steps.extend(analysis.implementation_steps)
-        
-        # Remove duplicates while preserving order
-        requirements = list(dict.fromkeys(all_requirements))
-        implementation_steps = list(dict.fromkeys(all_implementation_steps))
-        
-        # Calculate confidence score
-        # Rule: Average confidence weighted by compliance requirement
-        confidence_scores = [
-            analysis.confidence 
-            for analysis in analyses 
-            if analysis.confidence > 0
-        ]
-        overall_confidence = statistics.mean(confidence_scores) if confidence_scores else 0.5
+            if analysis.risk_level > overall_risk_level:
+                overall_risk_level = analysis.risk_level
+            if analysis.confidence > 0:
+                confidence_sum += analysis.confidence
+                confidence_count += 1
+            if not analysis.compliance_required:
+                continue
+            compliance_required = True
+            if analysis.jurisdiction not in seen_jurisdictions:
+                seen_jurisdictions.add(analysis.jurisdiction)
+                applicable_jurisdictions.append(analysis.jurisdiction)
+            for requirement in analysis.requirements:
+                if requirement not in seen_requirements:
+                    seen_requirements.add(requirement)
+                    requirements.append(requirement)
+            for step in analysis.implementation_steps:
+                if step not in seen_steps:
+                    seen_steps.add(step)
+                    implementation_steps.append(step)
+        
+        overall_risk_level = overall_risk_level or 1
+        overall_confidence = confidence_sum / confidence_count if confidence_count else 0.5
         
         # Generate reasoning
-        reasoning = self._generate_reasoning(analyses, compliance_required, overall_risk_level)
+        reasoning = self._generate_reasoning(applicable_jurisdictions, compliance_required, overall_risk_level)
         
         # Calculate analysis time
-        end_time = datetime.now()
-        analysis_time = (end_time - start_time).total_seconds()
+        analysis_time = (time.perf_counter_ns() - start_perf) / 1e9
         
         return FeatureAnalysisResponse(
             feature_id=feature_id,
@@ -844,16 +1704,19 @@ JSON format:
             reasoning=reasoning,
             jurisdiction_details=analyses,
             analysis_time=analysis_time,
-            created_at=end_time
+            created_at=datetime.now(timezone.utc)
         )
     
     def _generate_reasoning(
         self, 
-        analyses: List[JurisdictionAnalysis], 
+        jurisdiction_names: List[str], 
         compliance_required: bool,
         risk_level: int
     ) -> str:
-        """Generate human-readable reasoning for the decision"""
+        """
+        Generate human-readable reasoning for the decision
+        jurisdiction_names: compliance-requiring jurisdictions, as collected by _synthesize_decision's pass
+        """
         
         if not compliance_required:
             return (
@@ -861,10 +1724,6 @@ JSON format:
                 "Feature appears to have minimal regulatory impact based on current assessment."
             )
         
-        # Count jurisdictions requiring compliance
-        compliant_jurisdictions = [a for a in analyses if a.compliance_required]
-        jurisdiction_names = [a.jurisdiction for a in compliant_jurisdictions]
-        
         reasoning_parts = [
             f"Compliance required in {len(jurisdiction_names)} jurisdiction(s): {', '.join(jurisdiction_names)}."
         ]
@@ -875,12 +1734,10 @@ JSON format:
             reasoning_parts.append("Moderate risk level requiring careful implementation of regulatory requirements.")
         
         # Add specific jurisdiction insights
-        key_concerns = []
-        for analysis in compliant_jurisdictions:
-            if analysis.jurisdiction.lower() == "utah" and analysis.compliance_required:
-                key_concerns.append("Utah Social Media Act restrictions")
-            elif analysis.jurisdiction.lower() == "eu" and analysis.compliance_required:
-                key_concerns.append("EU transparency and user rights requirements")
+        key_concerns = [
+            concern for name in jurisdiction_names
+            if (concern := _CONCERNS_MAP.get(name.lower()))
+        ]
         
         if key_concerns:
             reasoning_parts.append(f"Key concerns: {', '.join(key_concerns)}.")
@@ -891,7 +1748,7 @@ JSON format:
         self, 
         context: Dict[str, Any], 
         feature_id: str, 
-        start_time: datetime
+        start_perf: int
     ) -> FeatureAnalysisResponse:
         """
         Create LLM-based legal analysis when MCP is disabled
@@ -906,144 +1763,158 @@ JSON format:
         risk_indicators = context.get("risk_indicators", [])
         
         # Use ONLY the configurable system prompt
-        system_prompt = get_system_prompt()
-        knowledge_base = get_knowledge_base()
+        system_prompt = _cached_system_prompt()
+        knowledge_base = _cached_knowledge_base()
         
-        analysis_prompt = f"""{system_prompt}
-
-Analyze this uploaded document/feature:
+        analysis_system = _knowledge_system(system_prompt, knowledge_base, FEATURE_ANALYSIS_INSTRUCTIONS)
+        analysis_prompt = f"""Analyze this uploaded document/feature:
 
 **Feature Name**: {feature_name}
 **Description**: {expanded_description}
 **Category**: {feature_category}
 **Geographic Context**: {', '.join(geographic_implications) if geographic_implications else 'Not specified'}
-**Risk Indicators**: {', '.join(risk_indicators) if risk_indicators else 'None identified'}
-
-Knowledge Base:
-{knowledge_base}
-
-Provide compliance analysis in JSON format:
-{{
-    "compliance_required": boolean,
-    "risk_level": integer (1-5 scale),
-    "applicable_jurisdictions": [relevant jurisdictions],
-    "requirements": [specific regulatory requirements],
-    "implementation_steps": [key implementation steps],
-    "reasoning": "explanation",
-    "confidence_score": float (0.0-1.0)
-}}
-
-Respond ONLY with valid JSON."""
+**Risk Indicators**: {', '.join(risk_indicators) if risk_indicators else 'None identified'}"""
 
+        cache_key = LRUCache.make_key(
+            "feature_analysis", _normalize_text(feature_name), _normalize_text(expanded_description),
+            feature_category, sorted(geographic_implications), sorted(risk_indicators), system_prompt, knowledge_base
+        )
+        
+        analysis_content = ""
         try:
-            # Get LLM analysis
-            response = await llm_client.complete(analysis_prompt, max_tokens=1200, temperature=0.1)
-            analysis_content = response.get("content", "")
-            
-            # Parse JSON response (handle markdown code blocks)
-            
-            # Extract JSON from markdown code blocks if present
-            json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', analysis_content, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                json_str = analysis_content.strip()
-            
-            analysis_data = json.loads(json_str)
+            # Get LLM analysis - every provider is constrained to the schema, so the output
+            # is plain JSON; a decode error means a truncated response (text salvage below)
+            analysis_data = self.completion_cache.get(cache_key)
+            cached = analysis_data is not None
+            if not cached:
+                response = await self._complete_coalesced(
+                    analysis_prompt,
+                    max_tokens=settings.llm_max_tokens_feature_analysis,
+                    temperature=0.0,
+                    response_format=FEATURE_ANALYSIS_SCHEMA,
+                    system=analysis_system
+                )
+                analysis_content = response.get("content", "")
+                analysis_data = _loads_json(analysis_content)
             
-            end_time = datetime.now()
-            analysis_time = (end_time - start_time).total_seconds()
+            analysis_time = (time.perf_counter_ns() - start_perf) / 1e9
             
-            return FeatureAnalysisResponse(
+            analysis = FeatureAnalysisResponse(
                 feature_id=feature_id,
                 feature_name=feature_name,
                 compliance_required=analysis_data.get("compliance_required", False),
-                risk_level=analysis_data.get("risk_level", 1),
+                # Bounds are enforced here - Gemini's response schema rejects minimum/maximum
+                risk_level=min(max(int(analysis_data.get("risk_level", 1)), 1), 5),
                 applicable_jurisdictions=analysis_data.get("applicable_jurisdictions", []),
                 requirements=analysis_data.get("requirements", []),
                 implementation_steps=analysis_data.get("implementation_steps", []),
-                confidence_score=analysis_data.get("confidence_score", 0.7),
+                confidence_score=min(max(float(analysis_data.get("confidence_score", 0.7)), 0.0), 1.0),
                 reasoning=analysis_data.get("reasoning", "LLM-based legal analysis completed."),
                 jurisdiction_details=[],  # No detailed jurisdiction breakdown without MCP
                 analysis_time=analysis_time,
-                created_at=end_time
+                created_at=datetime.now(timezone.utc)
             )
             
+            # Only cache output that validated - a rejected response is retried next time
+            if not cached:
+                self.completion_cache.put(cache_key, analysis_data)
+            return analysis
+            
         except json.JSONDecodeError as e:
             # LLM didn't return valid JSON, try to extract useful information anyway
-            return await self._create_text_based_analysis(context, feature_id, start_time, analysis_content)
+            return await self._create_text_based_analysis(context, feature_id, start_perf, analysis_content)
         except Exception as e:
             # Other errors, fallback to basic analysis 
-            return await self._create_basic_fallback(context, feature_id, start_time)
+            return await self._create_basic_fallback(context, feature_id, start_perf)
 
     async def _create_text_based_analysis(
         self,
         context: Dict[str, Any],
         feature_id: str, 
-        start_time: datetime,
+        start_perf: int,
         llm_text_response: str
     ) -> FeatureAnalysisResponse:
         """Parse non-JSON LLM response to extract useful analysis"""
         
-        end_time = datetime.now()
-        analysis_time = (end_time - start_time).total_seconds()
-        
         feature_name = context.get("original_feature", "Unknown Feature")
         text = llm_text_response.lower()
         
         # Extract compliance and risk information from text
-        compliance_required = any(phrase in text for phrase in [
-            "compliance required", "regulatory requirements", "must comply", 
-            "violation", "regulation applies", "legal requirements"
-        ])
-        
-        # Extract risk level using LLM intelligence
-        risk_level = await self._extract_risk_level_with_llm(llm_text_response)
+        compliance_required = _COMPLIANCE_PHRASE_RE.search(text) is not None
+        
+        # One scan for jurisdiction mentions; the LLM is only consulted for whatever
+        # the text doesn't state explicitly
+        mentioned_jurisdictions = {}  # ordered set - first mention first
+        mentions_global = needs_llm_jurisdictions = False
+        for match in _TEXT_ANALYSIS_RE.finditer(llm_text_response):
+            if match.group("jurisdiction"):
+                mentioned_jurisdictions[_JURISDICTION_SYNONYMS[match.group("jurisdiction").lower()]] = None
+            elif match.group("global"):
+                mentions_global = True
+            else:
+                needs_llm_jurisdictions = True
         
-        if compliance_required and risk_level == 1:
-            risk_level = 3  # Default to moderate if compliance required but no explicit level
-            
-        # Extract jurisdictions mentioned using LLM intelligence
-        available_jurisdictions = []
+        # Extract jurisdictions mentioned using LLM intelligence (jurisdiction list cached per minute)
         if self.mcp_client:
-            try:
-                tools = await self.mcp_client.list_available_tools()
-                available_jurisdictions = [tool.get("jurisdiction", "") for tool in tools if tool.get("jurisdiction")]
-            except Exception:
-                available_jurisdictions = ["Utah", "EU", "California", "Florida", "Brazil"]
+            available_jurisdictions = await self._get_available_jurisdictions()
         else:
             available_jurisdictions = ["Utah", "EU", "California", "Florida", "Brazil"]
             
-        jurisdictions = await self._parse_jurisdictions_with_llm(llm_text_response, available_jurisdictions)
+        if mentions_global and not needs_llm_jurisdictions:
+            jurisdictions = list(available_jurisdictions)
+        elif mentioned_jurisdictions and not needs_llm_jurisdictions:
+            available = {j.lower(): j for j in available_jurisdictions}
+            jurisdictions = [available[j.lower()] for j in mentioned_jurisdictions if j.lower() in available]
+        else:
+            jurisdictions = []
+        
+        # Whatever the text doesn't state explicitly comes from the LLM - one combined call
+        # when both the risk level and the jurisdictions are missing
+        risk_level = _scan_risk_level(llm_text_response)
+        classification = None
+        if risk_level is None and not jurisdictions and available_jurisdictions:
+            classification = await self._classify_analysis_text(llm_text_response, available_jurisdictions)
+        if classification is not None:
+            risk_level, jurisdictions = classification
+        else:
+            # Extract risk level using LLM intelligence
+            risk_level = risk_level or await self._extract_risk_level_with_llm(llm_text_response)
+            if not jurisdictions:
+                jurisdictions = await self._parse_jurisdictions_with_llm(llm_text_response, available_jurisdictions)
+        
+        if compliance_required and risk_level == 1:
+            risk_level = 3  # Default to moderate if compliance required but no explicit level
         
         # Generate reasoning from LLM text
         reasoning = f"LLM Analysis: {llm_text_response[:300]}..." if len(llm_text_response) > 300 else llm_text_response
         
+        # Timed after the risk level / jurisdiction parsing calls so they are included
+        analysis_time = (time.perf_counter_ns() - start_perf) / 1e9
+        
         return FeatureAnalysisResponse(
             feature_id=feature_id,
             feature_name=feature_name,
             compliance_required=compliance_required,
             risk_level=risk_level,
-            applicable_jurisdictions=list(set(jurisdictions)),
+            applicable_jurisdictions=_dedup(jurisdictions),
             requirements=[],  # Can't extract detailed requirements from text
             implementation_steps=[],  # Can't extract detailed steps from text
             confidence_score=0.6 if compliance_required else 0.7,
             reasoning=reasoning,
             jurisdiction_details=[],
             analysis_time=analysis_time,
-            created_at=end_time
+            created_at=datetime.now(timezone.utc)
         )
 
     async def _create_basic_fallback(
         self, 
         context: Dict[str, Any], 
         feature_id: str, 
-        start_time: datetime
+        start_perf: int
     ) -> FeatureAnalysisResponse:
         """Basic rule-based fallback if LLM analysis fails"""
         
-        end_time = datetime.now()
-        analysis_time = (end_time - start_time).total_seconds()
+        analysis_time = (time.perf_counter_ns() - start_perf) / 1e9
         
         return FeatureAnalysisResponse(
             feature_id=feature_id,
@@ -1057,7 +1928,7 @@ Respond ONLY with valid JSON."""
             reasoning="Analysis failed: Unable to process feature description. Manual legal review recommended.",
             jurisdiction_details=[],
             analysis_time=analysis_time,
-            created_at=end_time
+            created_at=datetime.now(timezone.utc)
         )
     
     # ===== LLM-BASED PARSING METHODS =====
@@ -1077,16 +1948,7 @@ User Response: "{user_response}"
 
 Available Jurisdictions: {available_jurisdictions}
 
-Rules:
-1. Match jurisdictions mentioned explicitly or through common abbreviations/synonyms
-2. "Global", "worldwide", "all regions" = ALL available jurisdictions
-3. "EU", "Europe", "European" = EU
-4. "CA", "Cali" = California
-5. "FL" = Florida
-6. "US", "America" without specifics = all US jurisdictions (Utah, California, Florida)
-7. If unclear or no matches, return empty list
-
-Return ONLY a JSON array of matched jurisdiction names: ["jurisdiction1", "jurisdiction2"]"""
+{JURISDICTION_PARSE_RULES}"""
         
         return await self._llm_parse_with_retry(prompt, self._parse_jurisdiction_list_response)
     
@@ -1103,17 +1965,7 @@ User Response: "{user_response}"
 
 Available Risk Categories: {available_categories}
 
-Identify which risk categories apply based on the user's description. Consider:
-- "Payment", "financial", "money", "transactions" → payment processing
-- "Kids", "children", "minors", "under 18" → minor protection
-- "Personal data", "privacy", "information" → data processing
-- "Posts", "videos", "moderation" → content moderation
-- "Verify age", "age check" → age verification
-- "Reports", "transparency" → transparency reporting
-- "User rights", "access data" → user rights
-- "International", "cross-border" → cross-border data transfer
-
-Return ONLY a JSON array of matched category names: ["category1", "category2"]"""
+{RISK_CATEGORY_HINTS}"""
         
         return await self._llm_parse_with_retry(prompt, self._parse_risk_list_response)
     
@@ -1123,43 +1975,75 @@ Return ONLY a JSON array of matched category names: ["category1", "category2"]""
         """
         if not text_response.strip():
             return 1
+        
+        # Fast path: an explicit "risk level N" / "high risk" statement needs no LLM call
+        stated_level = _scan_risk_level(text_response)
+        if stated_level:
+            return stated_level
             
         prompt = f"""Extract the risk level from this legal analysis text.
 
 Text: "{text_response[:500]}..."
 
-Risk Level Scale:
-1 = Minimal/No risk
-2 = Low risk  
-3 = Moderate risk
-4 = High risk
-5 = Critical risk
-
-Look for:
-- Explicit mentions like "risk level 3", "high risk", "critical"
-- Severity indicators: "minimal", "low", "moderate", "high", "critical"
-- Compliance implications: major violations = higher risk
-- Legal consequences mentioned
-
-Return ONLY a single integer 1-5: 3"""
+{RISK_LEVEL_SCALE}"""
         
         return await self._llm_parse_with_retry(prompt, self._parse_risk_level_response, default_value=1)
     
+    async def _classify_analysis_text(self, text_response: str, available_jurisdictions: List[str]) -> Optional[Tuple[int, List[str]]]:
+        """
+        Risk level and jurisdictions of an analysis text from one schema-constrained LLM call
+        (instead of _extract_risk_level_with_llm + _parse_jurisdictions_with_llm)
+        Returns None if the call fails so the caller can fall back to the separate parses
+        """
+        prompt = f"""Text: "{text_response[:500]}..."
+
+Available Jurisdictions: {available_jurisdictions}"""
+        
+        try:
+            response = await self._complete_coalesced(
+                prompt,
+                max_tokens=150,
+                temperature=0.0,
+                response_format=TEXT_CLASSIFICATION_SCHEMA,
+                system=TEXT_CLASSIFICATION_INSTRUCTIONS,
+                tier="fast"
+            )
+            data = _parse_llm_json(response.get("content", ""))
+        except Exception as e:
+            logger.warning("Combined text classification failed: %s", e)
+            return None
+        if not isinstance(data, dict) or not isinstance(data.get("risk_level"), int):
+            return None
+        
+        canonical = {j.lower(): j for j in available_jurisdictions}
+        jurisdictions = _dedup(
+            canonical[j.lower()] for j in data.get("jurisdictions") or [] if isinstance(j, str) and j.lower() in canonical
+        )
+        return min(max(data["risk_level"], 1), 5), jurisdictions
+    
     async def _llm_parse_with_retry(self, prompt: str, parser_func, default_value=None):
         """
         Execute LLM parsing with retry logic for robustness
+        Parses are pure functions of the prompt (greedy decoding), so successful results are memoized
         """
+        cache_key = LRUCache.make_key("llm_parse", parser_func.__name__, _normalize_text(prompt))
+        cached = self.parse_cache.get(cache_key)
+        if cached is not None:
+            return list(cached) if isinstance(cached, list) else cached
+        
         last_error = None
         
         for attempt in range(self.max_llm_retries):
             try:
-                response = await llm_client.complete(prompt, max_tokens=150, temperature=0.1)
+                response = await llm_client.complete(prompt, max_tokens=150, temperature=0.0, tier="fast")
                 content = response.get("content", "").strip()
                 
                 if not content:
                     raise ValueError("Empty LLM response")
                     
-                return parser_func(content)
+                result = parser_func(content)
+                self.parse_cache.put(cache_key, result)
+                return list(result) if isinstance(result, list) else result
                 
             except Exception as e:
                 last_error = e
@@ -1172,7 +2056,7 @@ Return ONLY a single integer 1-5: 3"""
                     break
         
         # All retries failed - return default
-        print(f"LLM parsing failed after {self.max_llm_retries} retries: {last_error}")
+        logger.warning("LLM parsing failed after %d retries: %s", self.max_llm_retries, last_error)
         return default_value if default_value is not None else []
     
     def _parse_jurisdiction_list_response(self, llm_response: str) -> List[str]:
@@ -1182,15 +2066,17 @@ Return ONLY a single integer 1-5: 3"""
         try:
             # Try JSON parsing first
             if llm_response.startswith('[') and llm_response.endswith(']'):
-                return json.loads(llm_response)
+                return _loads_json(llm_response)
                 
-            # Extract JSON from text if wrapped
-            json_match = re.search(r'\[.*?\]', llm_response)
-            if json_match:
-                return json.loads(json_match.group(0))
+            # Extract JSON from text if wrapped (balanced scan, so nested or multi-line arrays work)
+            if '[' in llm_response:
+                try:
+                    return _loads_json(_extract_json_object(llm_response, "[]"))
+                except json.JSONDecodeError:
+                    pass
                 
             # Fallback: look for quoted strings
-            quoted_matches = re.findall(r'"([^"]+)"', llm_response)
+            quoted_matches = _QUOTED_STRING_RE.findall(llm_response)
             if quoted_matches:
                 return quoted_matches
                 
@@ -1217,18 +2103,13 @@ Return ONLY a single integer 1-5: 3"""
         """
         try:
             # Look for single digit
-            digit_match = re.search(r'\b([1-5])\b', llm_response)
+            digit_match = _RISK_DIGIT_RE.search(llm_response)
             if digit_match:
                 return int(digit_match.group(1))
                 
             # Look for written numbers
-            text_to_num = {
-                'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
-                'minimal': 1, 'low': 2, 'moderate': 3, 'high': 4, 'critical': 5
-            }
-            
             response_lower = llm_response.lower()
-            for text, num in text_to_num.items():
+            for text, num in _RISK_WORDS.items():
                 if text in response_lower:
                     return num
                     
@@ -1238,64 +2119,62 @@ Return ONLY a single integer 1-5: 3"""
         except Exception:
             return 1
     
-    async def _is_global_deployment_request(self, user_response: str) -> bool:
-        """
-        Determine if user response indicates global deployment
-        """
-        prompt = f"""Analyze this user response: "{user_response}"
-
-Question: Does this response indicate GLOBAL or WORLDWIDE deployment?
-
-Look for indicators like:
-- "Global", "worldwide", "everywhere", "all regions"
-- "International", "globally", "world-wide" 
-- "All countries", "all markets"
-- "Universal deployment"
-
-Return ONLY: true or false"""
-        
-        result = await self._llm_parse_with_retry(prompt, self._parse_boolean_response, default_value=False)
-        return result
-    
-    async def _is_multiple_regions_request(self, user_response: str) -> bool:
-        """
-        Determine if user response indicates multiple specific regions
-        """
-        prompt = f"""Analyze this user response: "{user_response}"
-
-Question: Does this response indicate MULTIPLE SPECIFIC regions (not global)?
-
-Look for indicators like:
-- "Multiple", "several", "specific regions"
-- "Some countries", "certain areas" 
-- "A few jurisdictions", "select markets"
-- Lists like "US and EU" or "California and Florida"
-
-Return ONLY: true or false"""
-        
-        result = await self._llm_parse_with_retry(prompt, self._parse_boolean_response, default_value=False)
-        return result
-    
-    def _parse_boolean_response(self, llm_response: str) -> bool:
-        """
-        Parse LLM response into boolean with robust fallback
-        """
-        response_lower = llm_response.lower().strip()
+    async def _classify_geographic_response(self, user_response: str, available_jurisdictions: List[str]) -> Dict[str, Any]:
+        """
+        Classify a geographic clarification (global? multiple unnamed regions? which jurisdictions?)
+        with one schema-constrained LLM call instead of three separate parse round-trips
+        """
+        classification = {"is_global": False, "is_multiple": False, "jurisdictions": []}
+        answer = user_response.strip().lower()
+        if not answer:
+            return classification
+        
+        # Fast path: the offered options and common one-word answers need no LLM call
+        if answer in _GLOBAL_SCOPE_ANSWERS:
+            classification["is_global"] = True
+            return classification
+        if answer in _MULTIPLE_SCOPE_ANSWERS:
+            classification["is_multiple"] = True
+            return classification
+        canonical = {j.lower(): j for j in available_jurisdictions}
+        named = canonical.get(answer.removesuffix(" only"))
+        if named:
+            classification["jurisdictions"] = [named]
+            return classification
+        names_re = _jurisdiction_names_re(frozenset(canonical))
+        if (_GLOBAL_SCOPE_RE.search(answer) and not _SCOPE_NEGATION_RE.search(answer)
+                and not (names_re and names_re.search(answer))):
+            classification["is_global"] = True
+            return classification
+        
+        prompt = f"""User Response: "{user_response}"
+
+Available Jurisdictions: {available_jurisdictions}"""
         
-        # Direct boolean responses
-        if response_lower in ['true', 'yes', '1']:
-            return True
-        if response_lower in ['false', 'no', '0']:
-            return False
-            
-        # Look for boolean indicators in text
-        if any(word in response_lower for word in ['true', 'yes', 'correct', 'indicates']):
-            return True
-        if any(word in response_lower for word in ['false', 'no', 'incorrect', 'does not']):
-            return False
-            
-        # Default fallback
-        return False
+        try:
+            response = await self._complete_coalesced(
+                prompt,
+                max_tokens=150,
+                temperature=0.0,
+                response_format=GEOGRAPHIC_CLASSIFICATION_SCHEMA,
+                system=GEOGRAPHIC_CLASSIFICATION_RULES,
+                tier="fast"
+            )
+            data = _parse_llm_json(response.get("content", ""))
+        except Exception as e:
+            logger.warning("Geographic classification failed: %s", e)
+            return classification
+        if not isinstance(data, dict):
+            return classification
+        
+        # Keep only jurisdictions that exist, in their canonical spelling
+        jurisdictions = data.get("jurisdictions") or []
+        classification["is_global"] = data.get("is_global") is True
+        classification["is_multiple"] = data.get("is_multiple") is True
+        classification["jurisdictions"] = _dedup(
+            canonical[j.lower()] for j in jurisdictions if isinstance(j, str) and j.lower() in canonical
+        )
+        return classification
     
     # ===== AUTONOMOUS WORKFLOW METHODS =====
     # New methods for autonomous chat orchestration with HITL integration
@@ -1333,14 +2212,14 @@ Return ONLY: true or false"""
             self.session_locks[session_id] = asyncio.Lock()
         else:
             # Add new message to existing conversation
-            self.active_sessions[session_id].conversation_history.append({
-                "role": "user", 
-                "content": user_message
-            })
-        
-        # Run autonomous workflow loop
-        async with self.session_locks[session_id]:
-            return await self._autonomous_workflow_loop(session_id, user_message, context)
+            async with self.session_locks[session_id]:
+                state = self.active_sessions[session_id]
+                state.push_message("user", user_message)
+                state.version += 1
+        
+        # Run autonomous workflow loop - the session lock is only held around state
+        # mutations so LLM/MCP awaits don't block polling or new messages
+        return await self._autonomous_workflow_loop(session_id, user_message, context)
     
     async def _autonomous_workflow_loop(
         self, 
@@ -1357,6 +2236,15 @@ Return ONLY: true or false"""
         if not state:
             return f"❌ **Analysis Failed**: Session {session_id} not found"
         
+        # One loop per session: a running loop sees the new message through the state version
+        # at its next decision, or runs a follow-up loop for it when it finishes
+        async with self.session_locks[session_id]:
+            if session_id in self._running_loops:
+                logger.info(f"🔁 Workflow loop already running for session {session_id}")
+                self._queued_messages.add(session_id)
+                return session_id  # Return session_id for polling
+            self._running_loops.add(session_id)
+        
         max_iterations = 20  # Increased to allow for proper workflow completion
         iteration = 0
         
@@ -1390,14 +2278,14 @@ Return ONLY: true or false"""
                         }
                     )
                     final_response = await self._generate_final_response(session_id, response_action)
-                    state.status = "completed"
+                    await self._set_status(session_id, "completed")
                     return final_response
                 
-                # PREVENT SPAM: If we're waiting for HITL or have pending decisions, stop making new ones
+                # PREVENT SPAM: If we're waiting for HITL or have pending decisions, stop making new ones -
+                # handle_hitl_response starts the next loop once the user answers
                 if state.status == "waiting_hitl" or state.pending_mcp_decision:
                     logger.info(f"⏸️ Already waiting for HITL approval, skipping new decision generation (iteration {iteration})")
-                    await asyncio.sleep(1.0)  # Wait before checking again
-                    continue
+                    return session_id  # Return session_id for polling
                 
                 # Get next action from LLM using configurable prompts
                 next_action = await self._decide_next_action(session_id, user_message, context)
@@ -1415,10 +2303,10 @@ Return ONLY: true or false"""
                             action_type="response",
                             details={"reasoning": "Emergency completion after failures", "response_type": "compliance_gaps"}
                         ))
-                        state.status = "completed"
+                        await self._set_status(session_id, "completed")
                         return final_response
                     else:
-                        state.status = "completed"
+                        await self._set_status(session_id, "completed")
                         return "❌ **Analysis Failed** - Unable to complete analysis due to workflow errors."
                     
                 # Execute the action
@@ -1449,10 +2337,13 @@ Return ONLY: true or false"""
                         # MCP calls require HITL approval
                         await self._request_mcp_approval(session_id, next_action)
                         # Check if state changed (duplicate detected, status set to active)
-                        if state.status == "active":
+                        async with self.session_locks[session_id]:
+                            still_active = state.status == "active"
+                            if not still_active:
+                                state.status = "waiting_hitl"
+                        if still_active:
                             # Duplicate detected, continue to next iteration to get new LLM decision
                             continue
-                        state.status = "waiting_hitl"
                         return session_id  # Return session_id for polling
                         
                 elif next_action.action_type == "analysis":
@@ -1466,21 +2357,21 @@ Return ONLY: true or false"""
                         }
                     )
                     final_response = await self._generate_final_response(session_id, response_action)
-                    state.status = "completed"
+                    await self._set_status(session_id, "completed")
                     return final_response
                     
                 elif next_action.action_type == "response":
                     final_response = await self._generate_final_response(session_id, next_action)
-                    state.status = "completed"
+                    await self._set_status(session_id, "completed")
                     return final_response
                     
                 elif next_action.action_type == "hitl_prompt":
                     await self._request_user_input(session_id, next_action)
-                    state.status = "waiting_hitl"
+                    await self._set_status(session_id, "waiting_hitl")
                     return session_id  # Return session_id for polling
                 
-                # Brief yield for responsiveness
-                await asyncio.sleep(0.05)
+                # Yield to the event loop without adding wall-clock delay
+                await asyncio.sleep(0)
             
             # Max iterations reached - FORCE FINAL ANALYSIS
             if iteration >= max_iterations:
@@ -1496,16 +2387,41 @@ Return ONLY: true or false"""
                         action_type="response",
                         details={"reasoning": "Max iterations reached - emergency completion with sufficient data", "response_type": "compliance_gaps"}
                     ))
-                    state.status = "completed"
+                    await self._set_status(session_id, "completed")
                     return final_response
                 else:
                     logger.error(f"❌ Insufficient data: req calls: {requirements_calls}, legal calls: {legal_calls}")
-                    state.status = "completed"
+                    await self._set_status(session_id, "completed")
                     return f"⏰ **Analysis Failed** - Insufficient data collected. Need minimum 1 requirements call and 1 legal call. Got {requirements_calls} requirements, {legal_calls} legal."
                 
         except Exception as e:
-            state.status = "error"
+            await self._set_status(session_id, "error")
             return f"❌ **Analysis Failed**: {str(e)}"
+        finally:
+            await self._finish_workflow_loop(session_id, context)
+    
+    async def _finish_workflow_loop(self, session_id: str, context: Optional[str]):
+        """Release the session's loop slot; a message no decision has seen yet gets a follow-up loop"""
+        state = self.active_sessions[session_id]
+        async with self.session_locks[session_id]:
+            self._running_loops.discard(session_id)
+            queued = session_id in self._queued_messages and state.status != "waiting_hitl"
+            if queued:
+                # A pending HITL decision resumes with the latest message through handle_hitl_response
+                self._queued_messages.discard(session_id)
+                state.status = "active"
+            last_user_message = next(
+                (m["content"] for m in reversed(state.conversation_history) if m.get("role") == "user"), ""
+            )
+        if queued:
+            task = asyncio.create_task(self._autonomous_workflow_loop(session_id, last_user_message, context))
+            self._workflow_tasks.add(task)
+            task.add_done_callback(self._workflow_tasks.discard)
+    
+    async def _set_status(self, session_id: str, status: str):
+        """Session status transition under the session lock"""
+        async with self.session_locks[session_id]:
+            self.active_sessions[session_id].status = status
     
     async def _decide_next_action(
         self, 
@@ -1516,35 +2432,104 @@ Return ONLY: true or false"""
         """
         Autonomous decision-making using configurable system prompt
         Replaces hardcoded prompt with get_system_prompt()
+        Snapshots session state under the lock and releases it while awaiting the LLM
         """
         
         state = self.active_sessions.get(session_id)
         if not state:
             return None
         
-        decision_start = datetime.now()
+        lock = self.session_locks[session_id]
         
-        # Build context from conversation and tool results
-        conversation_context = "\n".join([
-            f"{msg['role']}: {msg['content']}" 
-            for msg in state.conversation_history
-        ])
+        # Keep the prompt bounded by folding turns that left the window into the summary
+        await self._summarize_if_needed(session_id)
         
-        tool_results_context = "\n".join([
-            f"Tool Result: {json.dumps(result, indent=2)}"
-            for result in state.tool_results
-        ])
+        for attempt in range(self.max_decision_retries):
+            # Critical section: snapshot the state this decision is based on
+            async with lock:
+                snapshot_version = state.version
+                self._queued_messages.discard(session_id)  # This decision sees every message so far
+                snapshot = state.model_copy(update={
+                    "conversation_history": list(state.conversation_history),
+                    "tool_results": list(state.tool_results),
+                    "reasoning_steps": list(state.reasoning_steps)
+                })
+            
+            # IO section: LLM call runs without holding the session lock
+            decision_start = time.perf_counter_ns()
+            action = await self._request_agent_decision(snapshot, user_message, context)
+            
+            async with lock:
+                if state.version != snapshot_version:
+                    # A decision based on stale state is never applied
+                    logger.info(f"🔄 Session {session_id} changed during decision, retrying")
+                    continue
+                
+                if action:
+                    # Record reasoning step
+                    decision_duration = (time.perf_counter_ns() - decision_start) / 1e9
+                    state.add_reasoning_step(ReasoningStep(
+                        type="cache_hit" if action.details.get("cache_hit") else "llm_decision",
+                        content=f"Decided to {action.action_type}: {action.details.get('reasoning', '')}",
+                        duration=decision_duration,
+                        timestamp=datetime.now().isoformat()
+                    ))
+                    state.version += 1
+                
+                return action
+        
+        logger.warning(f"🔄 Session {session_id} kept changing during {self.max_decision_retries} decisions, giving up")
+        return None
+    
+    async def _request_agent_decision(
+        self,
+        state: AutonomousAgentState,
+        user_message: str,
+        context: Optional[str]
+    ) -> Optional[AgentAction]:
+        """
+        Build the decision prompt from a state snapshot and ask the LLM for the next action
+        Equivalent decision states are served from the decision cache
+        Does not mutate session state
+        """
         
-        reasoning_steps_context = "\n".join([
-            f"Step {i+1}: {step.type.upper()} - {step.content}"
-            for i, step in enumerate(state.reasoning_steps)
-        ]) or "No previous reasoning steps"
+        analysis_count = state.analysis_count
         
-        # Count analysis steps for efficiency
-        analysis_count = len([
-            step for step in state.reasoning_steps 
-            if step.type == "llm_decision" and "analysis" in step.content.lower()
-        ])
+        # Use configurable system prompt and knowledge base
+        system_prompt = _cached_system_prompt()
+        knowledge_base = _cached_knowledge_base()
+        
+        # Compact JSON - the LLM does not need pretty-printing, and fewer tokens are cheaper
+        tool_results_context = state.joined_tool_results()
+        
+        # Cache key: normalized projection of the decision state, ignoring volatile fields. A cached
+        # decision can carry final response content, so the key covers what the response is grounded
+        # in - the tool results and the prompt / knowledge base it was decided under
+        cache_key = LRUCache.make_key(
+            _normalize_text(user_message),
+            [(msg["role"], _normalize_text(msg["content"])) for msg in state.conversation_history[-4:]],
+            LRUCache.make_key(tool_results_context),
+            LRUCache.make_key(system_prompt, knowledge_base),
+            analysis_count,
+            state.mcp_sent_count
+        )
+        cached_content = self.decision_cache.get(cache_key)
+        if cached_content is not None:
+            action = self._parse_agent_decision(cached_content, analysis_count)
+            if action:
+                action.details["cache_hit"] = True
+                logger.info(f"⚡ Decision cache hit: {action.action_type}")
+            return action
+        
+        # Build context from conversation and tool results
+        conversation_context = self._conversation_context(state)
+        
+        # Only the most recent steps are shown so the prompt does not grow with session length
+        first_step = state.evicted_steps + max(len(state.reasoning_steps) - REASONING_CONTEXT_STEPS, 0)
+        reasoning_steps_context = "\n".join(
+            f"Step {i}: {step.type.upper()} - {step.content}"
+            for i, step in enumerate(state.reasoning_steps[-REASONING_CONTEXT_STEPS:], start=first_step + 1)
+        ) or "No previous reasoning steps"
         
         # Count recent MCP calls to prevent rapid duplicates
         recent_mcp_calls = len([
@@ -1564,66 +2549,36 @@ Return ONLY: true or false"""
                 except:
                     recent_mcp_execution = False
         
-        # Use configurable system prompt and knowledge base
-        system_prompt = get_system_prompt()
-        knowledge_base = get_knowledge_base()
-        
-        # Enhanced autonomous agent system prompt with configurable content
-        decision_prompt = f"""{system_prompt}
-
-=== CURRENT CONTEXT ===
-User Request: {user_message}
-Conversation History:
-{conversation_context}
-
-PREVIOUS REASONING STEPS:
-{reasoning_steps_context}
-
-Previous Tool Results:
-{tool_results_context}
-
-STATE ANALYSIS:
-- Analysis decisions made: {analysis_count}
-- Tool calls made: {len(state.tool_results)}
-- MCP calls made: {state.mcp_sent_count} (limit: 5 per session)
-- Recent MCP calls: {recent_mcp_calls}
-- Just executed MCP: {"Yes" if recent_mcp_execution else "No"}
-
-Knowledge Base:
-{knowledge_base}
-
-=== DECISION FORMAT ===
-Respond with exactly this format:
-
-ACTION_TYPE: [mcp_call|analysis|response|hitl_prompt]
-REASONING: [Your strategic reasoning for this choice - 1-2 sentences]
-RESPONSE_CONTENT: [If action_type is "response", provide focused compliance gap report ONLY]
-DETAILS: [For other action types: specific MCP query, analysis focus, etc.]
-
-=== WORKFLOW PROGRESSION RULES ===
-- mcp_call: Use when you need MORE information (requirements OR legal rules) AND tool calls < 3
-- analysis: Use when you have BOTH requirements AND legal context to analyze OR tool calls >= 3
-- response: Use when analysis is COMPLETE and ready to provide final compliance report
-- CRITICAL: If tool calls >= 3, you MUST choose analysis or response, NEVER mcp_call
-- AVOID: Repeating similar MCP calls - move to next workflow step
-- If "Just executed MCP: Yes", prefer analysis or response over another mcp_call
-
-What is your autonomous decision for the next action?"""
+        # Static prefix (cacheable by the provider) and volatile per-turn context
+        decision_system = _knowledge_system(system_prompt, knowledge_base, DECISION_INSTRUCTIONS)
+        
+        decision_prompt = "\n".join((
+            "=== CURRENT CONTEXT ===",
+            f"User Request: {user_message}",
+            "Conversation History:",
+            conversation_context,
+            "",
+            "PREVIOUS REASONING STEPS:",
+            reasoning_steps_context,
+            "",
+            "Previous Tool Results:",
+            tool_results_context,
+            "",
+            "STATE ANALYSIS:",
+            f"- Analysis decisions made: {analysis_count}",
+            f"- Tool calls made: {len(state.tool_results)}",
+            f"- MCP calls made: {state.mcp_sent_count} (limit: 5 per session)",
+            f"- Recent MCP calls: {recent_mcp_calls}",
+            f"- Just executed MCP: {'Yes' if recent_mcp_execution else 'No'}",
+            "",
+            "What is your autonomous decision for the next action?"
+        ))
 
         try:
             # Use user's API keys if provided
-            current_llm_client = llm_client
-            if state.api_keys:
-                from ..llm_service import create_llm_client
-                current_llm_client = create_llm_client(state.api_keys)
-            
-            response = await current_llm_client.complete(
-                decision_prompt,
-                max_tokens=2000,
-                temperature=0.1
-            )
+            current_llm_client = self._llm_client_for(state)
             
-            content = response.get("content", "").strip()
+            content = (await self._single_flight_decision(current_llm_client, decision_prompt, decision_system)).strip()
             
             # Parse agent decision (reuse existing parsing logic)
             action = self._parse_agent_decision(content, analysis_count)
@@ -1633,21 +2588,128 @@ What is your autonomous decision for the next action?"""
             logger.info(f"🎯 Parsed Action: {action.action_type if action else 'FAILED TO PARSE'}")
             
             if action:
-                # Record reasoning step
-                decision_duration = (datetime.now() - decision_start).total_seconds()
-                state.reasoning_steps.append(ReasoningStep(
-                    type="llm_decision",
-                    content=f"Decided to {action.action_type}: {action.details.get('reasoning', '')}",
-                    duration=decision_duration,
-                    timestamp=datetime.now().isoformat()
-                ))
+                self.decision_cache.put(cache_key, content)
             
             return action
             
-        except Exception as e:
-            logger.error(f"❌ Decision failed: {e}")
+        except Exception:
+            logger.exception("❌ Decision failed")
             return None
     
+    async def _single_flight_decision(self, client, prompt: str, system: str) -> str:
+        """
+        Stream a decision, sharing one LLM call between concurrent identical requests
+        Covers the window before the first result lands in the decision cache
+        """
+        key = hashlib.blake2b(
+            f"decision\x00{id(client)}\x00{system}\x00{prompt}".encode(),
+            digest_size=16
+        ).hexdigest()
+        return await self._single_flight(key, lambda: self._stream_decision(client, prompt, system))
+    
+    async def _complete_coalesced(self, prompt: str, client=None, **kwargs) -> Dict[str, Any]:
+        """llm_client.complete() with identical concurrent requests sharing one call"""
+        client = client or llm_client
+        key = hashlib.blake2b(
+            f"complete\x00{id(client)}\x00{_compact_json(kwargs, sort_keys=True)}\x00{prompt}".encode(),
+            digest_size=16
+        ).hexdigest()
+        return await self._single_flight(key, lambda: client.complete(prompt, **kwargs))
+    
+    async def _single_flight(self, key: str, make_call: Callable[[], Any]) -> Any:
+        """Run make_call() once per key among concurrent callers and share its result"""
+        task = self._inflight_llm_calls.get(key)
+        if task is None:
+            task = asyncio.create_task(make_call())
+            self._inflight_llm_calls[key] = task
+            task.add_done_callback(lambda _: self._inflight_llm_calls.pop(key, None))
+        
+        # Shield so one cancelled waiter doesn't cancel the call for the others
+        return await asyncio.shield(task)
+    
+    def _conversation_context(self, state: AutonomousAgentState) -> str:
+        """Rolling summary of older turns followed by the recent, unsummarized turns"""
+        recent_turns = state.joined_conversation(start=state.conversation_summary_upto)
+        if not state.conversation_summary:
+            return recent_turns
+        return f"Summary of earlier conversation: {state.conversation_summary}\n{recent_turns}"
+    
+    async def _summarize_if_needed(self, session_id: str):
+        """
+        Fold turns that slid out of the conversation window into state.conversation_summary
+        Runs once per conversation_window new turns, so prompts stay bounded in size
+        """
+        state = self.active_sessions.get(session_id)
+        if not state:
+            return
+        
+        new_upto = len(state.conversation_history) - self.conversation_window
+        if new_upto < state.conversation_summary_upto + self.conversation_window:
+            return
+        
+        turns = "\n".join(
+            f"{msg['role']}: {msg['content']}"
+            for msg in state.conversation_history[state.conversation_summary_upto:new_upto]
+        )
+        summary_prompt = f"""Previous Summary:
+{state.conversation_summary or "None"}
+
+New Turns:
+{turns}"""
+        
+        try:
+            # Use user's API keys if provided
+            current_llm_client = self._llm_client_for(state)
+            
+            response = await current_llm_client.complete(
+                summary_prompt, max_tokens=250, temperature=0.1, system=CONVERSATION_SUMMARY_INSTRUCTIONS
+            )
+            summary = response.get("content", "").strip()
+            if not summary:
+                return
+            
+            async with self.session_locks[session_id]:
+                state.conversation_summary = summary
+                state.conversation_summary_upto = new_upto
+                state.version += 1
+                
+        except Exception as e:
+            # Keep the full history in the prompt rather than lose turns
+            logger.warning("Conversation summarization failed: %s", e)
+    
+    async def _stream_decision(self, client, prompt: str, system: str) -> str:
+        """
+        Stream the decision response, stopping generation as soon as the DETAILS line is complete
+        for actions that carry no RESPONSE_CONTENT
+        """
+        chunks = []
+        stream = client.stream(prompt, max_tokens=2000, temperature=0.1, system=system)
+        try:
+            async for chunk in stream:
+                if chunk.get("done"):
+                    break
+                chunks.append(chunk.get("content", ""))
+                if self._decision_header_complete("".join(chunks)):
+                    logger.info("✂️ Decision details complete, stopping generation early")
+                    break
+        finally:
+            await stream.aclose()
+        
+        return "".join(chunks)
+    
+    def _decision_header_complete(self, buffer: str) -> bool:
+        """
+        True once ACTION_TYPE is an early-exit action and its DETAILS line (the MCP query or
+        HITL question, last in DECISION_INSTRUCTIONS) has ended
+        """
+        fields = {}
+        for match in _DECISION_FIELD_RE.finditer(buffer):
+            fields[_DECISION_FIELD_ALIASES[match.group(1).lower()]] = match.group(2)
+        
+        action_type = fields.get("action_type", "").split("\n", 1)[0].strip()
+        details = fields.get("details", "").lstrip()
+        return action_type in _EARLY_EXIT_ACTIONS and "\n" in details
+    
     def _intelligent_fallback_action(self, state: AutonomousAgentState) -> Optional[AgentAction]:
         """
         Intelligent fallback when LLM decision parsing fails
@@ -1722,54 +2784,25 @@ What is your autonomous decision for the next action?"""
         details = {}
         response_content = ""
         
-        # Parse structured response with robust fuzzy matching
-        lines = content.split('\n')
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            line_lower = line.lower()
-            
-            # Flexible ACTION_TYPE parsing
-            if line_lower.startswith(("action_type:", "action:", "type:", "next action:")):
-                colon_pos = line.find(':')
-                if colon_pos != -1:
-                    action_type = line[colon_pos+1:].strip()
-                    
-            # Flexible REASONING parsing  
-            elif line_lower.startswith(("reasoning:", "reason:", "rationale:")):
-                colon_pos = line.find(':')
-                if colon_pos != -1:
-                    reasoning = line[colon_pos+1:].strip()
-                    
-            # Flexible RESPONSE_CONTENT parsing
-            elif line_lower.startswith(("response_content:", "response:", "content:")):
-                colon_pos = line.find(':')
-                if colon_pos != -1:
-                    response_lines = []
-                    first_line_content = line[colon_pos+1:].strip()
-                    if first_line_content:
-                        response_lines.append(first_line_content)
-                    
-                    i += 1
-                    while i < len(lines):
-                        next_line = lines[i].strip()
-                        next_lower = next_line.lower()
-                        if (next_lower.startswith(("details:", "action_type:", "reasoning:", "action:", "type:"))):
-                            i -= 1
-                            break
-                        if next_line:
-                            response_lines.append(next_line)
-                        i += 1
-                    
-                    response_content = "\n".join(response_lines).strip()
-                    
-            # Flexible DETAILS parsing
-            elif line_lower.startswith(("details:", "detail:")):
-                colon_pos = line.find(':')
-                if colon_pos != -1:
-                    details_str = line[colon_pos+1:].strip()
-                    details = {"description": details_str}
-            i += 1
+        # Parse structured response with robust fuzzy matching - single pass over the text
+        for match in _DECISION_FIELD_RE.finditer(content):
+            field = _DECISION_FIELD_ALIASES[match.group(1).lower()]
+            value = match.group(2)
+            
+            if field == "response_content":
+                # Multi-line block: keep non-empty lines
+                response_content = "\n".join(
+                    line.strip() for line in value.split("\n") if line.strip()
+                )
+            else:
+                # Single-line fields: only the text on the label line
+                value = value.split("\n", 1)[0].strip()
+                if field == "action_type":
+                    action_type = value
+                elif field == "reasoning":
+                    reasoning = value
+                else:
+                    details = {"description": value}
         
         # FALLBACK: Try keyword-based parsing if structured parsing failed
         if not action_type:
@@ -1792,14 +2825,14 @@ What is your autonomous decision for the next action?"""
         
         # Fallback parsing with MCP awareness
         if not action_type or action_type not in ["mcp_call", "analysis", "response", "hitl_prompt"]:
-            content_lower = content.lower()
-            if "mcp_call" in content_lower or "legal_mcp" in content_lower or "requirements_mcp" in content_lower:
+            keywords = set(_DECISION_KEYWORD_RE.findall(content.lower()))
+            if keywords & {"mcp_call", "legal_mcp", "requirements_mcp"}:
                 action_type = "mcp_call"
                 reasoning = "Fallback: Detected MCP call in response"
-            elif "analysis" in content_lower and analysis_count < 3:
+            elif "analysis" in keywords and analysis_count < 3:
                 action_type = "analysis"
                 reasoning = "Fallback: Detected analysis request"
-            elif "response" in content_lower or analysis_count >= 3:
+            elif "response" in keywords or analysis_count >= 3:
                 action_type = "response"
                 reasoning = "Fallback: Ready to provide response"
             else:
@@ -1835,6 +2868,8 @@ What is your autonomous decision for the next action?"""
         mcp_details = await self._determine_mcp_tool(session_id, action)
         if not mcp_details:
             return
+        # Stash the tool selection so execution doesn't repeat the LLM call
+        action.details["mcp_details"] = mcp_details
         
         # Store the pending MCP action for execution after approval
         state = self.active_sessions[session_id]
@@ -1845,7 +2880,7 @@ What is your autonomous decision for the next action?"""
             if result.get('tool') == mcp_details["tool"]
         ]
         if mcp_details["query"] in existing_queries:
-            print(f"⚠️ Duplicate MCP query detected: {mcp_details['query']} - forcing immediate analysis")
+            logger.warning("⚠️ Duplicate MCP query detected: %s - forcing immediate analysis", mcp_details['query'])
             # IMMEDIATE ANALYSIS: Don't wait for next LLM loop, execute analysis NOW
             analysis_action = AgentAction(
                 action_type="analysis",
@@ -1865,21 +2900,19 @@ What is your autonomous decision for the next action?"""
                 }
             )
             final_response = await self._generate_final_response(session_id, response_action)
-            state.status = "completed"
-            
-            # Store final response so frontend can retrieve it
-            state.conversation_history.append({
-                "role": "assistant", 
-                "content": final_response
-            })
+            async with self.session_locks[session_id]:
+                state.status = "completed"
+                # Store final response so frontend can retrieve it
+                state.push_message("assistant", final_response)
             return
-        state.pending_mcp_decision = {
-            "action": "mcp_call",
-            "tool": mcp_details["tool"],
-            "query": mcp_details["query"],
-            "reasoning": mcp_details["reasoning"],
-            "original_action": action.dict()  # Store full action details
-        }
+        async with self.session_locks[session_id]:
+            state.pending_mcp_decision = {
+                "action": "mcp_call",
+                "tool": mcp_details["tool"],
+                "query": mcp_details["query"],
+                "reasoning": mcp_details["reasoning"],
+                "original_action": action.dict()  # Store full action details
+            }
             
         approval_prompt = {
             "type": "mcp_approval",
@@ -1905,62 +2938,42 @@ What is your autonomous decision for the next action?"""
         if not state:
             return None
         
+        # Clear-cut cases are picked without an LLM round trip
+        heuristic = self._heuristic_mcp_tool(state, action.details.get("description", ""))
+        if heuristic:
+            async with self.session_locks[session_id]:
+                state.add_reasoning_step(ReasoningStep(
+                    type="heuristic_tool_pick",
+                    content=f"Picked {heuristic['tool']} from decision details: {heuristic['query']}",
+                    duration=0.0,
+                    timestamp=datetime.now().isoformat()
+                ))
+                state.version += 1
+            return heuristic
+        
         # Build context for MCP tool selection
-        conversation_context = "\n".join([
-            f"{msg['role']}: {msg['content']}" 
-            for msg in state.conversation_history[-3:]  # Last 3 messages
-        ])
+        conversation_context = state.joined_conversation(last_n=3)
         
-        tool_results_context = "\n".join([
+        tool_results_context = "\n".join(
             f"Previous MCP: {result.get('tool', 'unknown')}" 
             for result in state.tool_results[-2:]  # Last 2 results
-        ]) or "No previous MCP calls"
+        ) or "No previous MCP calls"
         
-        decision_prompt = f"""You are an autonomous legal compliance agent. You must decide which MCP tool to call and what query to use.
-
-=== CONVERSATION CONTEXT ===
+        decision_prompt = f"""=== CONVERSATION CONTEXT ===
 {conversation_context}
 
 === PREVIOUS MCP CALLS ===
-{tool_results_context}
-
-=== WORKFLOW GUIDANCE ===
-1. FIRST: Use requirements_mcp to extract document requirements (if not done)
-2. THEN: Use legal_mcp to check requirements against specific jurisdictions
-3. AVOID: Repeating the same MCP tool with similar queries
-
-=== AVAILABLE TOOLS ===
-REQUIREMENTS MCP TOOLS:
-- Tool: requirements_mcp
-- For document content: Use query "document_id:UUID extract requirements"
-- For semantic search: Use query "your search terms"
-- Use ONCE per document to extract requirements
-
-LEGAL MCP TOOLS:
-- Tool: legal_mcp  
-- For compliance checking: Use query "Utah compliance [requirement type]"
-- Example: "Utah social media user data requirements"
-- Use AFTER you have requirements to check compliance
-
-=== DECISION FORMAT ===
-TOOL: [legal_mcp|requirements_mcp]
-QUERY: [your specific search query]
-REASONING: [brief 10-word reason for tool choice]
-
-IMPORTANT: If you already extracted requirements, use legal_mcp for compliance checking.
-Make your decision based on workflow progression and previous calls."""
+{tool_results_context}"""
 
         try:
             # Use user's API keys if provided
-            current_llm_client = llm_client
-            if state.api_keys:
-                from ..llm_service import create_llm_client
-                current_llm_client = create_llm_client(state.api_keys)
+            current_llm_client = self._llm_client_for(state)
             
             response = await current_llm_client.complete(
                 decision_prompt,
                 max_tokens=200,
-                temperature=0.1
+                temperature=0.1,
+                system=MCP_TOOL_SELECTION_INSTRUCTIONS
             )
             
             content = response.get("content", "").strip()
@@ -1988,9 +3001,55 @@ Make your decision based on workflow progression and previous calls."""
             
             return None
             
-        except Exception as e:
-            print(f"❌ MCP tool decision failed: {e}")
+        except Exception:
+            logger.exception("❌ MCP tool decision failed")
+            return None
+    
+    @staticmethod
+    def _heuristic_mcp_tool(state: AutonomousAgentState, description: str) -> Optional[Dict[str, str]]:
+        """
+        Pick the MCP tool from unambiguous keywords in the decision details
+        Returns None when the text is ambiguous or the pick would repeat an earlier query
+        """
+        description = (description or "").strip()
+        if not description:
+            return None
+        
+        document_match = _DOCUMENT_ID_RE.search(description)
+        if document_match:
+            mcp_details = {
+                "tool": "requirements_mcp",
+                "query": f"document_id:{document_match.group(1)} extract requirements",
+                "reasoning": "Decision references a document ID"
+            }
+        else:
+            legal_hint = _LEGAL_HINT_RE.search(description) is not None
+            requirements_hint = _REQUIREMENTS_HINT_RE.search(description) is not None
+            if legal_hint == requirements_hint:
+                return None  # Neither or both tools hinted at - leave the pick to the LLM
+            
+            # Search terms only: first line, without the instruction wording and tool names
+            query = _DETAILS_PREAMBLE_RE.sub("", description.splitlines()[0].strip(), count=1)
+            query = " ".join(_DETAILS_TOOL_NAME_RE.sub(" ", query).split()).strip(" .:;,\"'")
+            if not query:
+                return None
+            if legal_hint:
+                mcp_details = {
+                    "tool": "legal_mcp",
+                    "query": query,
+                    "reasoning": "Decision names a jurisdiction or regulation"
+                }
+            else:
+                mcp_details = {
+                    "tool": "requirements_mcp",
+                    "query": query,
+                    "reasoning": "Decision asks for document requirements"
+                }
+        
+        previous_queries = {(result.get("tool"), result.get("query")) for result in state.tool_results}
+        if (mcp_details["tool"], mcp_details["query"]) in previous_queries:
             return None
+        return mcp_details
     
     async def _execute_mcp_call(self, session_id: str, action: AgentAction):
         """Execute approved MCP call and store results"""
@@ -1998,178 +3057,172 @@ Make your decision based on workflow progression and previous calls."""
         if not state:
             return
         
-        # Get MCP details
-        mcp_details = await self._determine_mcp_tool(session_id, action)
+        # Get MCP details - reuse the selection made at approval time if present
+        mcp_details = action.details.get("mcp_details") or await self._determine_mcp_tool(session_id, action)
         if not mcp_details:
             return
         
-        execution_start = datetime.now()
+        execution_start = time.perf_counter_ns()
         
         try:
             # Call appropriate MCP
-            if mcp_details["tool"] == "requirements_mcp":
-                # Parse query for document ID extraction  
-                query = mcp_details["query"]
-                if query.startswith("document_id:"):
-                    # Extract document ID for metadata search
-                    parts = query.split(" ", 1)
-                    doc_id = parts[0].replace("document_id:", "")
-                    search_query = parts[1] if len(parts) > 1 else "extract requirements"
-                    
-                    result = await self.mcp_client.call_tool("search_requirements", {
-                        "search_type": "metadata",
-                        "document_id": doc_id,
-                        "query": search_query
-                    })
-                else:
-                    # Regular semantic search
-                    result = await self.mcp_client.call_tool("search_requirements", {
-                        "search_type": "semantic",
-                        "query": query
-                    })
-                    
-            elif mcp_details["tool"] == "legal_mcp":
-                result = await self.mcp_client.call_tool("search_legal_documents", {
-                    "search_type": "semantic",
-                    "query": mcp_details["query"]
-                })
-            else:
-                result = {"error": f"Unknown MCP tool: {mcp_details['tool']}"}
-            
-            execution_time = (datetime.now() - execution_start).total_seconds()
-            
-            # Store result for context
-            state.tool_results.append({
-                "tool": mcp_details["tool"],
-                "query": mcp_details["query"],
-                "result": result,
-                "execution_time": execution_time
-            })
-            
-            # Store MCP execution for frontend display
-            results_count = len(result.get("results", [])) if isinstance(result, dict) else 0
-            state.mcp_executions_for_chat.append({
-                "tool": mcp_details["tool"],
-                "query": mcp_details["query"],
-                "results_count": results_count,
-                "execution_time": execution_time,
-                "result_summary": f"Found {results_count} results" if results_count > 0 else "No results",
-                "timestamp": datetime.now().isoformat(),
-                "raw_results": result
-            })
+            result, speculative_hit = await self._run_workflow_mcp(state, mcp_details)
             
-            state.mcp_sent_count += 1
+            execution_time = (time.perf_counter_ns() - execution_start) / 1e9
             
-            # Add reasoning step
-            state.reasoning_steps.append(ReasoningStep(
-                type="mcp_call",
-                content=f"Executed {mcp_details['tool']}: {mcp_details['query']}",
-                duration=execution_time,
-                timestamp=datetime.now().isoformat()
-            ))
+            async with self.session_locks[session_id]:
+                self._record_mcp_result(state, mcp_details, result, execution_time, speculative_hit)
             
-        except Exception as e:
-            print(f"❌ MCP execution failed: {e}")
+        except Exception:
+            logger.exception("❌ MCP execution failed")
     
-    async def _execute_pending_mcp_call(self, session_id: str):
-        """Execute the pending MCP call that was approved by user"""
-        state = self.active_sessions[session_id]
+    def _record_mcp_result(self, state: AutonomousAgentState, mcp_details: Dict[str, str],
+                           result: Dict[str, Any], execution_time: float, speculative_hit: bool):
+        """
+        Store an MCP result for context and frontend display (caller holds the session lock)
+        Both entries reference the same result dict; it is only serialized at the API boundary
+        """
+        results_count = len(result.get("results", [])) if isinstance(result, dict) else 0
+        timestamp = datetime.now().isoformat()
         
-        if not state.pending_mcp_decision:
-            return
+        # Store result for context
+        state.push_tool({
+            "tool": mcp_details["tool"],
+            "query": mcp_details["query"],
+            "result": result,
+            "execution_time": execution_time
+        })
         
-        mcp_details = state.pending_mcp_decision
-        execution_start = datetime.now()
+        # Store MCP execution for frontend display
+        state.mcp_executions_for_chat.append({
+            "tool": mcp_details["tool"],
+            "query": mcp_details["query"],
+            "results_count": results_count,
+            "execution_time": execution_time,
+            "result_summary": f"Found {results_count} results" if results_count > 0 else "No results",
+            "timestamp": timestamp,
+            "raw_results": result
+        })
         
-        try:
-            # Call appropriate MCP using the stored details
-            if mcp_details["tool"] == "requirements_mcp":
-                # Parse query for document ID extraction
-                query = mcp_details["query"]
-                if query.startswith("document_id:"):
-                    # Extract document ID for metadata search
-                    parts = query.split(" ", 1)
-                    doc_id = parts[0].replace("document_id:", "")
-                    search_query = parts[1] if len(parts) > 1 else "extract requirements"
-                    
-                    result = await self.mcp_client.call_tool("search_requirements", {
-                        "search_type": "metadata", 
-                        "document_id": doc_id,
-                        "query": search_query
-                    })
-                else:
-                    # Regular semantic search
-                    result = await self.mcp_client.call_tool("search_requirements", {
-                        "search_type": "semantic",
-                        "query": query
-                    })
-                    
-            elif mcp_details["tool"] == "legal_mcp":
-                result = await self.mcp_client.call_tool("search_legal_documents", {
-                    "search_type": "semantic",
-                    "query": mcp_details["query"]
+        state.mcp_sent_count += 1
+        
+        # Add reasoning step
+        state.add_reasoning_step(ReasoningStep(
+            type="speculative_hit" if speculative_hit else "mcp_call",
+            content=f"Executed {mcp_details['tool']}: {mcp_details['query']}",
+            duration=execution_time,
+            timestamp=timestamp
+        ))
+        state.version += 1
+    
+    @staticmethod
+    def _llm_client_for(state: AutonomousAgentState):
+        """LLM client for the session's API keys, falling back to the global client"""
+        return create_llm_client(state.api_keys) if state.api_keys else llm_client
+    
+    async def _call_workflow_mcp(self, tool: str, query: str) -> Dict[str, Any]:
+        """Dispatch a workflow-level MCP tool (requirements_mcp / legal_mcp) to the MCP client"""
+        if tool == "requirements_mcp":
+            # Parse query for document ID extraction
+            if query.startswith("document_id:"):
+                # Extract document ID for metadata search
+                parts = query.split(" ", 1)
+                doc_id = parts[0].replace("document_id:", "")
+                search_query = parts[1] if len(parts) > 1 else "extract requirements"
+                
+                return await self.mcp_client.call_tool("search_requirements", {
+                    "search_type": "metadata",
+                    "document_id": doc_id,
+                    "query": search_query
                 })
-            else:
-                result = {"error": f"Unknown MCP tool: {mcp_details['tool']}"}
-            
-            execution_time = (datetime.now() - execution_start).total_seconds()
             
-            # Store result for context
-            state.tool_results.append({
-                "tool": mcp_details["tool"],
-                "query": mcp_details["query"],
-                "result": result,
-                "execution_time": execution_time
+            # Regular semantic search
+            return await self.mcp_client.call_tool("search_requirements", {
+                "search_type": "semantic",
+                "query": query
             })
-            
-            # Store MCP execution for frontend display
-            results_count = len(result.get("results", [])) if isinstance(result, dict) else 0
-            state.mcp_executions_for_chat.append({
-                "tool": mcp_details["tool"],
-                "query": mcp_details["query"],
-                "results_count": results_count,
-                "execution_time": execution_time,
-                "result_summary": f"Found {results_count} results" if results_count > 0 else "No results",
-                "timestamp": datetime.now().isoformat(),
-                "raw_results": result
+        
+        elif tool == "legal_mcp":
+            return await self.mcp_client.call_tool("search_legal_documents", {
+                "search_type": "semantic",
+                "query": query
             })
+        
+        return {"error": f"Unknown MCP tool: {tool}"}
+    
+    async def _run_workflow_mcp(self, state: AutonomousAgentState, mcp_details: Dict[str, Any]):
+        """
+        Run the selected MCP call, speculatively pre-fetching the other tool early in the workflow
+        (only once the user has approved a call to that tool in this session)
+        Returns (result, speculative_hit)
+        """
+        tool = mcp_details["tool"]
+        query = mcp_details["query"]
+        
+        # Reuse a pre-fetched result for the same tool and a near-identical query
+        speculative = state.speculative_results.pop(tool, None)
+        if speculative and _query_overlap(speculative["query"], query) >= SPECULATIVE_QUERY_MIN_OVERLAP:
+            logger.info(f"⚡ Speculative MCP hit: {tool}")
+            return speculative["result"], True
+        
+        other_tool = {"requirements_mcp": "legal_mcp", "legal_mcp": "requirements_mcp"}.get(tool)
+        approved_tools = {result.get("tool") for result in state.tool_results}
+        if (other_tool in approved_tools and state.mcp_sent_count < 2
+                and not query.startswith("document_id:")):
+            result, other_result = await asyncio.gather(
+                self._call_workflow_mcp(tool, query),
+                self._call_workflow_mcp(other_tool, query),
+                return_exceptions=True
+            )
+            if isinstance(result, BaseException):
+                raise result
+            if not isinstance(other_result, BaseException):
+                state.speculative_results[other_tool] = {"query": query, "result": other_result}
+            return result, False
+        
+        return await self._call_workflow_mcp(tool, query), False
+    
+    async def _execute_pending_mcp_call(self, session_id: str, mcp_details: Dict[str, Any]):
+        """Execute the pending MCP call that was approved by user (claimed by handle_hitl_response)"""
+        state = self.active_sessions[session_id]
+        execution_start = time.perf_counter_ns()
+        
+        try:
+            # Call appropriate MCP using the stored details
+            result, speculative_hit = await self._run_workflow_mcp(state, mcp_details)
             
-            state.mcp_sent_count += 1
+            execution_time = (time.perf_counter_ns() - execution_start) / 1e9
             
-            # Add reasoning step
-            state.reasoning_steps.append(ReasoningStep(
-                type="mcp_call",
-                content=f"Executed {mcp_details['tool']}: {mcp_details['query']}",
-                duration=execution_time,
-                timestamp=datetime.now().isoformat()
-            ))
+            async with self.session_locks[session_id]:
+                self._record_mcp_result(state, mcp_details, result, execution_time, speculative_hit)
             
-            print(f"✅ MCP call executed successfully: {mcp_details['tool']} - {results_count} results")
+            logger.info(
+                "✅ MCP call executed successfully: %s - %d results",
+                mcp_details['tool'], len(result.get("results", [])) if isinstance(result, dict) else 0
+            )
             
-        except Exception as e:
-            print(f"❌ Pending MCP execution failed: {e}")
+        except Exception:
+            logger.exception("❌ Pending MCP execution failed")
     
     async def _perform_analysis(self, session_id: str, action: AgentAction):
         """Perform legal analysis using configurable prompts"""
         state = self.active_sessions[session_id]
         
-        system_prompt = get_system_prompt()
-        knowledge_base = get_knowledge_base()
+        system_prompt = _cached_system_prompt()
+        knowledge_base = _cached_knowledge_base()
         
         # Build analysis context
-        conversation_context = "\n".join([
-            f"{msg['role']}: {msg['content']}" 
-            for msg in state.conversation_history
-        ])
+        conversation_context = self._conversation_context(state)
         
-        tool_results_summary = "\n".join([
+        tool_results_summary = "\n".join(
             f"- {result.get('tool', 'unknown')}: {result.get('query', '')}" 
             for result in state.tool_results
-        ]) or "No tool results available"
+        ) or "No tool results available"
         
-        analysis_prompt = f"""{system_prompt}
-
-=== ANALYSIS TASK ===
+        # Static prefix (cacheable by the provider) and volatile analysis context
+        analysis_system = _knowledge_system(system_prompt, knowledge_base)
+        
+        analysis_prompt = f"""=== ANALYSIS TASK ===
 Analyze the conversation and tool results to identify compliance gaps.
 
 Conversation:
@@ -2178,33 +3231,28 @@ Conversation:
 Tool Results Available:
 {tool_results_summary}
 
-Knowledge Base:
-{knowledge_base}
-
 Focus on detection and reasoning only."""
         
         try:
             # Use user's API keys if provided
-            current_llm_client = llm_client
-            if state.api_keys:
-                from ..llm_service import create_llm_client
-                current_llm_client = create_llm_client(state.api_keys)
+            current_llm_client = self._llm_client_for(state)
             
-            analysis_start = datetime.now()
+            analysis_start = time.perf_counter_ns()
             response = await asyncio.wait_for(
                 current_llm_client.complete(
                     analysis_prompt,
                     max_tokens=300,  # Reduced for faster analysis
-                    temperature=0.1
+                    temperature=0.1,
+                    system=analysis_system
                 ),
                 timeout=15.0  # 15 second timeout for analysis
             )
             
             analysis_result = response.get("content", "Analysis failed").strip()
-            analysis_duration = (datetime.now() - analysis_start).total_seconds()
+            analysis_duration = (time.perf_counter_ns() - analysis_start) / 1e9
             
             # Store analysis step
-            state.reasoning_steps.append(ReasoningStep(
+            state.add_reasoning_step(ReasoningStep(
                 type="analysis",
                 content=f"Performed compliance gap analysis: {analysis_result[:100]}...",
                 duration=analysis_duration,
@@ -2214,14 +3262,14 @@ Focus on detection and reasoning only."""
         except asyncio.TimeoutError:
             logger.warning(f"⏰ Analysis timed out after 15 seconds, proceeding to response generation")
             # Store timeout analysis step
-            state.reasoning_steps.append(ReasoningStep(
+            state.add_reasoning_step(ReasoningStep(
                 type="analysis", 
                 content="Analysis timed out - proceeding with available MCP data",
                 duration=15.0,
                 timestamp=datetime.now().isoformat()
             ))
-        except Exception as e:
-            logger.error(f"❌ Analysis failed: {e}")
+        except Exception:
+            logger.exception("❌ Analysis failed")
     
     async def _generate_final_response(self, session_id: str, action: AgentAction) -> str:
         """Generate final compliance analysis response"""
@@ -2268,44 +3316,30 @@ Focus on detection and reasoning only."""
                     legal_data.append(str(mcp_result))
         
         # Build comprehensive response prompt
-        system_prompt = get_system_prompt()
+        system_prompt = _cached_system_prompt()
         
-        response_prompt = f"""{system_prompt}
-
-=== COMPLIANCE ANALYSIS REPORT ===
-Generate a comprehensive compliance analysis report based on the MCP research results.
-
-Requirements Found:
+        # Static prefix (cacheable by the provider); only the research results vary
+        response_system = _instruction_system(system_prompt, COMPLIANCE_REPORT_INSTRUCTIONS)
+        
+        response_prompt = f"""Requirements Found:
 {chr(10).join(requirements_data) if requirements_data else "No requirements data available"}
 
 Legal Regulations Found:
-{chr(10).join(legal_data) if legal_data else "No legal data available"}
-
-REPORT STRUCTURE:
-1. **Executive Summary** - Key compliance status and risk level
-2. **Requirements Analysis** - What the feature does
-3. **Regulatory Compliance** - Specific Utah law requirements  
-4. **Compliance Gaps** - Where requirements don't meet regulations
-5. **Recommendations** - Specific actions needed
-6. **Implementation Priority** - High/Medium/Low with timelines
-
-Make it actionable and specific to Utah Social Media Regulation Act."""
+{chr(10).join(legal_data) if legal_data else "No legal data available"}"""
         
         logger.info(f"🚀 Generating final response with {len(requirements_data)} requirements and {len(legal_data)} legal sources")
         
         try:
             # Use user's API keys if provided
-            current_llm_client = llm_client
-            if state.api_keys:
-                from ..llm_service import create_llm_client
-                current_llm_client = create_llm_client(state.api_keys)
+            current_llm_client = self._llm_client_for(state)
             
             # Add timeout for response generation
             response = await asyncio.wait_for(
                 current_llm_client.complete(
                     response_prompt,
                     max_tokens=1500,  # Reduced for faster response
-                    temperature=0.1
+                    temperature=0.1,
+                    system=response_system
                 ),
                 timeout=20.0  # 20 second timeout
             )
@@ -2360,31 +3394,34 @@ Make it actionable and specific to Utah Social Media Regulation Act."""
             
         state = self.active_sessions[session_id]
         
+        # Claim the pending MCP decision under the lock so a repeated response can't run it twice
+        async with self.session_locks[session_id]:
+            pending_mcp = state.pending_mcp_decision
+            if pending_mcp and response.lower() in ["approve", "skip", "reject"]:
+                state.pending_mcp_decision = None
+            else:
+                pending_mcp = None
+        
         # Check if this is a response to a pending MCP decision
         executed_mcp = False
-        if state.pending_mcp_decision and response.lower() == "approve":
+        if pending_mcp and response.lower() == "approve":
             # Execute the pending MCP call
-            await self._execute_pending_mcp_call(session_id)
-            # Clear the pending decision
-            state.pending_mcp_decision = None
+            await self._execute_pending_mcp_call(session_id, pending_mcp)
             executed_mcp = True
-        elif state.pending_mcp_decision and response.lower() in ["skip", "reject"]:
-            # Skip the MCP call - clear pending decision
-            state.pending_mcp_decision = None
         
-        state.status = "active"  # Resume from waiting_hitl
+        await self._set_status(session_id, "active")  # Resume from waiting_hitl
         
         # Add a brief pause if we just executed an MCP call to let results settle
         if executed_mcp:
             await asyncio.sleep(0.1)
         
-        # Continue workflow loop
-        async with self.session_locks[session_id]:
-            return await self._autonomous_workflow_loop(
-                session_id, 
-                state.conversation_history[-1]["content"],  # Last user message
-                None
-            )
+        # Continue workflow loop - it takes the session lock around state mutations and
+        # returns immediately if another loop is already driving this session
+        return await self._autonomous_workflow_loop(
+            session_id, 
+            state.conversation_history[-1]["content"],  # Last user message
+            None
+        )
 
 # TODO: MCP Integration - Enhanced version with caching and performance optimization
 # class EnhancedLawyerAgent(LawyerAgent):
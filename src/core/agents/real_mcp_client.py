@@ -3,15 +3,44 @@ Real MCP Client - Standard MCP Tool Integration
 Provides MCP tool calls to real MCP servers for lawyer agents
 """
 import asyncio
+import importlib.util
 import logging
 import os
-import subprocess
+import sys
 import json
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
+
+import aiohttp
+
 from ..models import JurisdictionAnalysis
 
 logger = logging.getLogger(__name__)
 
+# Parallel connections kept open to each MCP server (jurisdiction fan-out width)
+MCP_CONNECTIONS_PER_SERVER = 10
+
+# Bound on the startup health check that warms each server's connection pool
+MCP_WARMUP_TIMEOUT_SECONDS = 2.0
+
+
+@lru_cache(maxsize=1)
+def _requirements_call_tool():
+    """Load the requirements MCP server module once and return its call_tool"""
+    src_dir = os.path.join(os.getcwd(), 'src')
+    if src_dir not in sys.path:
+        sys.path.append(src_dir)
+    
+    # The package directory has a dash, so load server.py by path
+    spec = importlib.util.spec_from_file_location(
+        "requirements_mcp_server",
+        os.path.join(src_dir, "requirements-mcp", "server.py")
+    )
+    requirements_mcp_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(requirements_mcp_module)
+    return requirements_mcp_module.call_tool
+
+
 class RealMCPClient:
     """
     Real MCP client that makes standard MCP tool calls to our MCP servers
@@ -23,6 +52,10 @@ class RealMCPClient:
         self.legal_mcp_url = os.getenv('LEGAL_MCP_URL', 'http://localhost:8010')
         self.requirements_mcp_url = os.getenv('REQUIREMENTS_MCP_URL', 'http://localhost:8011')
         
+        # One persistent keep-alive session per MCP server, bound to the running loop
+        self._sessions: Dict[str, Any] = {}
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        
         # Available MCP tools
         self.available_tools = [
             {
@@ -57,6 +90,50 @@ class RealMCPClient:
             }
         ]
     
+    async def http_session(self, base_url: str):
+        """Persistent aiohttp session for one MCP server (created on first use); requests take relative paths"""
+        loop = asyncio.get_running_loop()
+        if self._session_loop is not loop:
+            # Sessions can't cross event loops - drop ones bound to an old loop
+            self._sessions = {}
+            self._session_loop = loop
+        
+        session = self._sessions.get(base_url)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                base_url=base_url,
+                connector=aiohttp.TCPConnector(limit_per_host=MCP_CONNECTIONS_PER_SERVER, keepalive_timeout=60)
+            )
+            self._sessions[base_url] = session
+        return session
+    
+    async def start(self):
+        """
+        Open the per-server sessions and warm each pool with a health check, so the first
+        query reuses an established keep-alive connection; unreachable servers are skipped
+        """
+        await asyncio.gather(*(
+            self._warm_up(base_url) for base_url in (self.legal_mcp_url, self.requirements_mcp_url)
+        ))
+    
+    async def _warm_up(self, base_url: str):
+        """GET /health once so a connection to the server is left open in the pool"""
+        session = await self.http_session(base_url)
+        try:
+            async with session.get("/health", timeout=aiohttp.ClientTimeout(total=MCP_WARMUP_TIMEOUT_SECONDS)) as response:
+                await response.read()  # Drain the body so the connection goes back to the pool
+        except Exception as e:
+            logger.info(f"MCP server {base_url} not reachable at startup, connecting on first use: {e}")
+    
+    async def close(self):
+        """Close every per-server HTTP session"""
+        sessions, self._sessions = self._sessions, {}
+        self._session_loop = None
+        await asyncio.gather(
+            *(session.close() for session in sessions.values() if not session.closed),
+            return_exceptions=True
+        )
+    
     async def list_available_tools(self) -> List[Dict[str, Any]]:
         """
         MCP protocol: Return list of available tools from both MCP servers
@@ -89,9 +166,6 @@ class RealMCPClient:
         """
         Call Legal MCP tool - Now uses real Legal MCP server
         """
-        import aiohttp
-        import json
-        
         try:
             if tool_name == "search_documents":
                 # Call real Legal MCP search endpoint
@@ -111,31 +185,31 @@ class RealMCPClient:
                 if document_content:
                     payload["document_content"] = document_content
                 
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(
-                        f"{self.legal_mcp_url}/api/v1/search",
-                        json=payload
-                    ) as response:
-                        if response.status == 200:
-                            result = await response.json()
-                            
-                            # Convert to consistent MCP tool response format
-                            if search_type == "similarity":
-                                return {
-                                    "search_type": "similarity",
-                                    "similar_documents": result.get("similar_documents", result.get("documents", [])),
-                                    "total_found": result.get("total_found", result.get("total_documents", 0)),
-                                    "search_time": result.get("search_time", result.get("retrieval_time", 0.0))
-                                }
-                            else:
-                                return {
-                                    "search_type": search_type,
-                                    "results": result.get("documents", []),
-                                    "total_results": result.get("total_documents", 0),
-                                    "search_time": result.get("retrieval_time", 0.0)
-                                }
+                session = await self.http_session(self.legal_mcp_url)
+                async with session.post(
+                    "/api/v1/search",
+                    json=payload
+                ) as response:
+                    if response.status == 200:
+                        result = await response.json()
+                        
+                        # Convert to consistent MCP tool response format
+                        if search_type == "similarity":
+                            return {
+                                "search_type": "similarity",
+                                "similar_documents": result.get("similar_documents", result.get("documents", [])),
+                                "total_found": result.get("total_found", result.get("total_documents", 0)),
+                                "search_time": result.get("search_time", result.get("retrieval_time", 0.0))
+                            }
                         else:
-                            return {"error": f"Legal MCP search failed: HTTP {response.status}"}
+                            return {
+                                "search_type": search_type,
+                                "results": result.get("documents", []),
+                                "total_results": result.get("total_documents", 0),
+                                "search_time": result.get("retrieval_time", 0.0)
+                            }
+                    else:
+                        return {"error": f"Legal MCP search failed: HTTP {response.status}"}
                             
             elif tool_name == "delete_document":
                 document_id = arguments.get("document_id")
@@ -167,22 +241,9 @@ class RealMCPClient:
             logger.info(f"🔍 Calling Requirements MCP with args={arguments}")
             
             try:
-                # Import and call the MCP function directly
-                import sys
-                import os
-                sys.path.append(os.path.join(os.getcwd(), 'src'))
-                
-                # Import with the correct path structure
+                # Import and call the MCP function directly (module loaded once per process)
                 try:
-                    # Try the dash version first
-                    import importlib.util
-                    spec = importlib.util.spec_from_file_location(
-                        "requirements_mcp_server", 
-                        os.path.join(os.getcwd(), "src", "requirements-mcp", "server.py")
-                    )
-                    requirements_mcp_module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(requirements_mcp_module)
-                    call_tool = requirements_mcp_module.call_tool
+                    call_tool = _requirements_call_tool()
                 except Exception as import_error:
                     logger.error(f"❌ Import error: {import_error}")
                     raise import_error
@@ -196,7 +257,6 @@ class RealMCPClient:
                     # MCP returns List[TextContent], convert to dict
                     text_content = result[0]
                     if hasattr(text_content, 'text'):
-                        import json
                         return json.loads(text_content.text)
                     else:
                         return {"error": "Invalid MCP response format"}
@@ -204,9 +264,7 @@ class RealMCPClient:
                     return {"error": "Empty response from MCP"}
                     
             except Exception as e:
-                logger.error(f"❌ Failed to call Requirements MCP directly: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception(f"❌ Failed to call Requirements MCP directly: {e}")
                 return {"error": f"Failed to call Requirements MCP: {str(e)}"}
         
         elif tool_name == "check_document_status":
@@ -215,16 +273,15 @@ class RealMCPClient:
                 return {"error": "document_id is required for status check"}
             
             # Call the requirements MCP status endpoint directly via HTTP
-            import aiohttp
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(f"{self.requirements_mcp_url}/api/v1/status/{document_id}") as response:
-                        if response.status == 200:
-                            return await response.json()
-                        elif response.status == 404:
-                            return {"error": "Document not found", "status": "not_found"}
-                        else:
-                            return {"error": f"Status check failed: HTTP {response.status}"}
+                session = await self.http_session(self.requirements_mcp_url)
+                async with session.get(f"/api/v1/status/{document_id}") as response:
+                    if response.status == 200:
+                        return await response.json()
+                    elif response.status == 404:
+                        return {"error": "Document not found", "status": "not_found"}
+                    else:
+                        return {"error": f"Status check failed: HTTP {response.status}"}
             except Exception as e:
                 logger.error(f"Status check failed for {document_id}: {e}")
                 return {"error": f"Status check failed: {str(e)}"}
@@ -303,16 +360,19 @@ class RealMCPClient:
         Legacy method: Execute parallel analysis across all jurisdictions
         """
         jurisdictions = await self.get_available_jurisdictions()
-        results = []
         
-        # Sequential execution for simplicity (can be made parallel)
-        for jurisdiction in jurisdictions:
-            try:
-                analysis = await self.analyze_feature(jurisdiction.lower(), feature_context)
-                results.append(analysis)
-            except Exception as e:
-                logger.error(f"Analysis failed for {jurisdiction}: {e}")
+        # One concurrent batch instead of N sequential round-trips; order follows jurisdictions
+        outcomes = await asyncio.gather(
+            *(self.analyze_feature(jurisdiction.lower(), feature_context) for jurisdiction in jurisdictions),
+            return_exceptions=True
+        )
+        
+        results = []
+        for jurisdiction, outcome in zip(jurisdictions, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Analysis failed for {jurisdiction}: {outcome}")
                 continue
+            results.append(outcome)
         
         return results
     
@@ -352,4 +412,23 @@ class RealMCPClient:
             
         except Exception as e:
             logger.error(f"Query search failed: {str(e)}")
-            return []
\ No newline at end of file
+            return []
+
+
+_shared_mcp_client: Optional[RealMCPClient] = None
+
+def get_shared_mcp_client() -> RealMCPClient:
+    """Process-wide MCP client shared by every LawyerAgent (one connection pool)"""
+    global _shared_mcp_client
+    if _shared_mcp_client is None:
+        _shared_mcp_client = RealMCPClient()
+    return _shared_mcp_client
+
+async def start_shared_mcp_client():
+    """Open the shared client's server sessions on application startup"""
+    await get_shared_mcp_client().start()
+
+async def close_shared_mcp_client():
+    """Release the shared client's HTTP session on application shutdown"""
+    if _shared_mcp_client is not None:
+        await _shared_mcp_client.close()
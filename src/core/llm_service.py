@@ -2,15 +2,25 @@
 Basic LLM Service - Phase 1 with Gemini Support
 Simple LLM client that supports multiple providers including Google Gemini
 """
+import asyncio
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Awaitable, List
 from enum import Enum
+from collections import OrderedDict
+import hashlib
 import json
 
 from ..config import settings
 
 logger = logging.getLogger(__name__)
 
+# Process-wide cap on in-flight provider calls (every client and agent shares it) so
+# concurrent analyses queue here instead of tripping provider rate limits
+_LLM_SLOTS = asyncio.Semaphore(settings.llm_max_concurrency)
+
+# Tool name used to force schema-conforming JSON output from Claude / OpenAI
+STRUCTURED_OUTPUT_TOOL = "structured_output"
+
 class LLMProvider(Enum):
     GEMINI_FLASH = "gemini-1.5-flash"
     GEMINI_PRO = "gemini-1.5-pro"
@@ -157,6 +167,10 @@ class SimpleLLMClient:
                 self.anthropic_client = anthropic.Anthropic(
                     api_key=anthropic_key
                 )
+                # Async client for streaming, so tokens are awaited instead of blocking the loop
+                self.async_anthropic_client = anthropic.AsyncAnthropic(
+                    api_key=anthropic_key
+                )
                 # Add all Claude models to available providers  
                 for model_id in CLAUDE_MODELS.keys():
                     # Create enum-like providers for each model
@@ -172,6 +186,10 @@ class SimpleLLMClient:
                 self.openai_client = openai.OpenAI(
                     api_key=openai_key
                 )
+                # Async client for streaming, so tokens are awaited instead of blocking the loop
+                self.async_openai_client = openai.AsyncOpenAI(
+                    api_key=openai_key
+                )
                 self.available_providers.append(LLMProvider.GPT_4)
                 logger.info("✅ OpenAI GPT client initialized")
             except Exception as e:
@@ -182,21 +200,31 @@ class SimpleLLMClient:
         else:
             logger.info(f"🎯 Available LLM providers: {[getattr(p, 'value', p) for p in self.available_providers]}")
     
-    async def complete(self, prompt: str, max_tokens: int = 2000, temperature: float = 0.1) -> Dict[str, Any]:
+    async def complete(self, prompt: str, max_tokens: int = 2000, temperature: float = 0.1, response_format: Optional[Dict[str, Any]] = None, system: Optional[str] = None, tier: str = "accurate") -> Dict[str, Any]:
         """
         Generate completion using preferred model or fallback chain
+        
+        response_format: optional JSON schema; every provider is forced to emit a JSON
+        document matching it (Gemini response schema, Claude/OpenAI forced tool call)
+        system: optional static prompt prefix sent as a system message so providers
+        can cache it across calls; prompt then carries only the volatile part
+        tier: "accurate" uses the preferred model; "fast" uses each provider's small
+        model (settings.llm_fast_*_model) for low-stakes fallback and parsing calls
         """
         
         if not self.available_providers:
             raise Exception("No LLM providers available. Please configure API keys.")
         
+        if tier == "fast":
+            return await self._complete_fast(prompt, max_tokens, temperature, response_format, system)
+        
         # If we have a preferred model, try it first
         if self.preferred_model:
             try:
                 if self.preferred_model in GEMINI_MODELS:
-                    return await self._complete_gemini(prompt, max_tokens, temperature, self.preferred_model)
+                    return await self._limited(self._complete_gemini(prompt, max_tokens, temperature, self.preferred_model, response_format, system))
                 elif self.preferred_model in CLAUDE_MODELS:
-                    return await self._complete_claude(prompt, max_tokens, temperature, self.preferred_model)
+                    return await self._limited(self._complete_claude(prompt, max_tokens, temperature, self.preferred_model, response_format, system))
             except Exception as e:
                 logger.warning(f"Preferred model {self.preferred_model} failed: {e}")
                 # Fall back to provider chain
@@ -206,11 +234,11 @@ class SimpleLLMClient:
             try:
                 if provider in [LLMProvider.GEMINI_FLASH, LLMProvider.GEMINI_PRO, 
                                LLMProvider.GEMINI_FLASH_8B, LLMProvider.GEMINI_2_FLASH]:
-                    return await self._complete_gemini(prompt, max_tokens, temperature, provider.value)
+                    return await self._limited(self._complete_gemini(prompt, max_tokens, temperature, provider.value, response_format, system))
                 elif hasattr(provider, 'value') and provider.value in CLAUDE_MODELS:
-                    return await self._complete_claude(prompt, max_tokens, temperature, provider.value)
+                    return await self._limited(self._complete_claude(prompt, max_tokens, temperature, provider.value, response_format, system))
                 elif provider == LLMProvider.GPT_4:
-                    return await self._complete_openai(prompt, max_tokens, temperature)
+                    return await self._limited(self._complete_openai(prompt, max_tokens, temperature, response_format, system))
                     
             except Exception as e:
                 logger.warning(f"LLM provider {getattr(provider, 'value', provider)} failed: {e}")
@@ -218,52 +246,133 @@ class SimpleLLMClient:
         
         raise Exception("All LLM providers failed")
     
-    async def stream(self, prompt: str, max_tokens: int = 2000, temperature: float = 0.1):
+    @staticmethod
+    async def _limited(call: Awaitable[Dict[str, Any]]) -> Dict[str, Any]:
+        """Await one provider call inside the shared concurrency budget"""
+        async with _LLM_SLOTS:
+            return await call
+    
+    async def _complete_fast(self, prompt: str, max_tokens: int, temperature: float, response_format: Optional[Dict[str, Any]] = None, system: Optional[str] = None) -> Dict[str, Any]:
+        """Complete on the small model of each configured provider, in the same provider order as complete()"""
+        
+        fast_models = {
+            "gemini": (settings.llm_fast_gemini_model, GEMINI_MODELS),
+            "claude": (settings.llm_fast_claude_model, CLAUDE_MODELS),
+            "openai": (settings.llm_fast_openai_model, None)
+        }
+        
+        for family in self._provider_families():
+            model_id, known_models = fast_models[family]
+            if known_models is not None and model_id not in known_models:
+                # An unknown ID would be swapped for the preferred model - skip it instead
+                logger.warning(f"Fast model {model_id} is not a known {family} model, skipping")
+                continue
+            try:
+                if family == "gemini":
+                    return await self._limited(self._complete_gemini(prompt, max_tokens, temperature, model_id, response_format, system))
+                elif family == "claude":
+                    return await self._limited(self._complete_claude(prompt, max_tokens, temperature, model_id, response_format, system))
+                else:
+                    return await self._limited(self._complete_openai(prompt, max_tokens, temperature, response_format, system, model_id))
+            except Exception as e:
+                logger.warning(f"Fast model {model_id} failed: {e}")
+        
+        # No small model answered - the accurate chain still gets the call through
+        return await self.complete(prompt, max_tokens, temperature, response_format, system)
+    
+    def _provider_families(self) -> List[str]:
+        """Configured provider families: the preferred model's first, then in availability order"""
+        families = []
+        for provider in self.available_providers:
+            value = getattr(provider, 'value', provider)
+            if value in GEMINI_MODELS:
+                family = "gemini"
+            elif value in CLAUDE_MODELS:
+                family = "claude"
+            elif value == LLMProvider.GPT_4.value:
+                family = "openai"
+            else:
+                continue
+            if family not in families:
+                families.append(family)
+        
+        preferred = "gemini" if self.preferred_model in GEMINI_MODELS else "claude" if self.preferred_model in CLAUDE_MODELS else None
+        if preferred in families:
+            families.remove(preferred)
+            families.insert(0, preferred)
+        return families
+    
+    async def stream(self, prompt: str, max_tokens: int = 2000, temperature: float = 0.1, system: Optional[str] = None):
         """
         Generate streaming completion using the first available provider
-        Yields tokens as they come from the LLM
+        Yields tokens as they come from the LLM; closing the generator early
+        (aclose) abandons the provider stream
         """
         
         if not self.available_providers:
             raise Exception("No LLM providers available. Please configure API keys.")
         
-        # Try providers in order of preference
-        for provider in self.available_providers:
-            try:
-                if provider in [LLMProvider.GEMINI_FLASH, LLMProvider.GEMINI_PRO, 
-                               LLMProvider.GEMINI_FLASH_8B, LLMProvider.GEMINI_2_FLASH]:
-                    async for chunk in self._stream_gemini(prompt, max_tokens, temperature, provider.value):
-                        yield chunk
-                    return
-                elif hasattr(provider, 'value') and provider.value in CLAUDE_MODELS:
-                    async for chunk in self._stream_claude(prompt, max_tokens, temperature, provider.value):
-                        yield chunk
-                    return
-                elif provider == LLMProvider.GPT_4:
-                    async for chunk in self._stream_openai(prompt, max_tokens, temperature):
+        # One concurrency slot for the whole stream (held until it finishes or is closed)
+        async with _LLM_SLOTS:
+            # If we have a preferred model, try it first
+            if self.preferred_model in GEMINI_MODELS or self.preferred_model in CLAUDE_MODELS:
+                started = False
+                try:
+                    if self.preferred_model in GEMINI_MODELS:
+                        preferred_stream = self._stream_gemini(prompt, max_tokens, temperature, self.preferred_model, system)
+                    else:
+                        preferred_stream = self._stream_claude(prompt, max_tokens, temperature, self.preferred_model, system)
+                    async for chunk in preferred_stream:
+                        started = True
                         yield chunk
                     return
+                except Exception as e:
+                    # Tokens already sent can't be taken back - only fall back before the first one
+                    if started:
+                        raise
+                    logger.warning(f"Preferred model {self.preferred_model} streaming failed: {e}")
+            
+            # Fallback: Try providers in order of availability
+            for provider in self.available_providers:
+                try:
+                    if provider in [LLMProvider.GEMINI_FLASH, LLMProvider.GEMINI_PRO, 
+                                   LLMProvider.GEMINI_FLASH_8B, LLMProvider.GEMINI_2_FLASH]:
+                        async for chunk in self._stream_gemini(prompt, max_tokens, temperature, provider.value, system):
+                            yield chunk
+                        return
+                    elif hasattr(provider, 'value') and provider.value in CLAUDE_MODELS:
+                        async for chunk in self._stream_claude(prompt, max_tokens, temperature, provider.value, system):
+                            yield chunk
+                        return
+                    elif provider == LLMProvider.GPT_4:
+                        async for chunk in self._stream_openai(prompt, max_tokens, temperature, system):
+                            yield chunk
+                        return
                     
-            except Exception as e:
-                logger.warning(f"LLM provider {provider.value} streaming failed: {e}")
-                continue
+                except Exception as e:
+                    logger.warning(f"LLM provider {provider.value} streaming failed: {e}")
+                    continue
         
         raise Exception("All LLM providers failed for streaming")
     
-    async def _complete_gemini(self, prompt: str, max_tokens: int, temperature: float, model_id: str = None) -> Dict[str, Any]:
+    async def _complete_gemini(self, prompt: str, max_tokens: int, temperature: float, model_id: str = None, response_format: Optional[Dict[str, Any]] = None, system: Optional[str] = None) -> Dict[str, Any]:
         """Complete using Google Gemini with specified model"""
         
         try:
-            # Use preferred model if set, otherwise use the passed model_id or default
-            if self.preferred_model:
-                model_to_use = self.preferred_model
-            elif model_id:
+            # Use the passed model_id (complete() pins the preferred or fast-tier model),
+            # otherwise the preferred model or default
+            if model_id in GEMINI_MODELS:
                 model_to_use = model_id
+            elif self.preferred_model in GEMINI_MODELS:
+                model_to_use = self.preferred_model
             else:
                 model_to_use = "gemini-1.5-flash"
             
-            # Create model client dynamically
-            gemini_client = self.genai.GenerativeModel(model_to_use)
+            # Create model client dynamically - static prefix goes in the system instruction
+            if system:
+                gemini_client = self.genai.GenerativeModel(model_to_use, system_instruction=system)
+            else:
+                gemini_client = self.genai.GenerativeModel(model_to_use)
             
             # Configure generation parameters
             generation_config = {
@@ -273,7 +382,14 @@ class SimpleLLMClient:
                 'top_k': 40
             }
             
-            response = gemini_client.generate_content(
+            # Constrained decoding: Gemini JSON mode with response schema
+            if response_format:
+                generation_config['response_mime_type'] = 'application/json'
+                generation_config['response_schema'] = response_format
+            
+            # The SDK call is blocking - run it off the event loop
+            response = await asyncio.to_thread(
+                gemini_client.generate_content,
                 prompt,
                 generation_config=generation_config
             )
@@ -288,20 +404,24 @@ class SimpleLLMClient:
             logger.error(f"Gemini API error: {e}")
             raise
     
-    async def _stream_gemini(self, prompt: str, max_tokens: int, temperature: float, model_id: str = None):
+    async def _stream_gemini(self, prompt: str, max_tokens: int, temperature: float, model_id: str = None, system: Optional[str] = None):
         """Stream using Google Gemini with specified model"""
         
         try:
-            # Use preferred model if set, otherwise use the passed model_id or default
-            if self.preferred_model:
-                model_to_use = self.preferred_model
-            elif model_id:
+            # Use the passed model_id (stream() pins the preferred or provider model),
+            # otherwise the preferred model or default
+            if model_id in GEMINI_MODELS:
                 model_to_use = model_id
+            elif self.preferred_model in GEMINI_MODELS:
+                model_to_use = self.preferred_model
             else:
                 model_to_use = "gemini-1.5-flash"
             
-            # Create model client dynamically
-            gemini_client = self.genai.GenerativeModel(model_to_use)
+            # Create model client dynamically - static prefix goes in the system instruction
+            if system:
+                gemini_client = self.genai.GenerativeModel(model_to_use, system_instruction=system)
+            else:
+                gemini_client = self.genai.GenerativeModel(model_to_use)
             
             # Configure generation parameters
             generation_config = {
@@ -311,13 +431,13 @@ class SimpleLLMClient:
                 'top_k': 40
             }
             
-            response = gemini_client.generate_content(
+            response = await gemini_client.generate_content_async(
                 prompt,
                 generation_config=generation_config,
                 stream=True  # Enable streaming
             )
             
-            for chunk in response:
+            async for chunk in response:
                 if chunk.text:
                     yield {
                         "content": chunk.text,
@@ -336,27 +456,56 @@ class SimpleLLMClient:
             logger.error(f"Gemini streaming API error: {e}")
             raise
     
-    async def _complete_claude(self, prompt: str, max_tokens: int, temperature: float, model_id: str = None) -> Dict[str, Any]:
+    async def _complete_claude(self, prompt: str, max_tokens: int, temperature: float, model_id: str = None, response_format: Optional[Dict[str, Any]] = None, system: Optional[str] = None) -> Dict[str, Any]:
         """Complete using Anthropic Claude with specified model"""
         
         try:
-            # Use preferred model if set, otherwise use the passed model_id or default
-            if self.preferred_model and self.preferred_model in CLAUDE_MODELS:
-                model_to_use = self.preferred_model
-            elif model_id and model_id in CLAUDE_MODELS:
+            # Use the passed model_id (complete() pins the preferred or fast-tier model),
+            # otherwise the preferred model or default
+            if model_id in CLAUDE_MODELS:
                 model_to_use = model_id
+            elif self.preferred_model in CLAUDE_MODELS:
+                model_to_use = self.preferred_model
             else:
                 model_to_use = "claude-sonnet-4-20250514"
             
-            response = self.anthropic_client.messages.create(
+            messages = [{"role": "user", "content": prompt}]
+            
+            request_kwargs = {}
+            if response_format:
+                # Claude has no JSON mode - force a tool call whose input schema is the response schema
+                request_kwargs["tools"] = [{
+                    "name": STRUCTURED_OUTPUT_TOOL,
+                    "description": "Return the response as structured JSON",
+                    "input_schema": response_format
+                }]
+                request_kwargs["tool_choice"] = {"type": "tool", "name": STRUCTURED_OUTPUT_TOOL}
+            if system:
+                # Mark the static prefix for Anthropic prompt caching
+                request_kwargs["system"] = [{
+                    "type": "text",
+                    "text": system,
+                    "cache_control": {"type": "ephemeral"}
+                }]
+            
+            # The SDK call is blocking - run it off the event loop
+            response = await asyncio.to_thread(
+                self.anthropic_client.messages.create,
                 model=model_to_use,
                 max_tokens=max_tokens,
                 temperature=temperature,
-                messages=[{"role": "user", "content": prompt}]
+                messages=messages,
+                **request_kwargs
             )
             
+            if response_format:
+                tool_input = next(block.input for block in response.content if block.type == "tool_use")
+                content = json.dumps(tool_input)
+            else:
+                content = response.content[0].text
+            
             return {
-                "content": response.content[0].text,
+                "content": content,
                 "model": model_to_use,
                 "tokens_used": response.usage.input_tokens + response.usage.output_tokens
             }
@@ -365,25 +514,36 @@ class SimpleLLMClient:
             logger.error(f"Claude API error: {e}")
             raise
     
-    async def _stream_claude(self, prompt: str, max_tokens: int, temperature: float, model_id: str = None):
+    async def _stream_claude(self, prompt: str, max_tokens: int, temperature: float, model_id: str = None, system: Optional[str] = None):
         """Stream using Anthropic Claude with specified model"""
         
         try:
-            # Use preferred model if set, otherwise use the passed model_id or default
-            if self.preferred_model and self.preferred_model in CLAUDE_MODELS:
-                model_to_use = self.preferred_model
-            elif model_id and model_id in CLAUDE_MODELS:
+            # Use the passed model_id (stream() pins the preferred or provider model),
+            # otherwise the preferred model or default
+            if model_id in CLAUDE_MODELS:
                 model_to_use = model_id
+            elif self.preferred_model in CLAUDE_MODELS:
+                model_to_use = self.preferred_model
             else:
                 model_to_use = "claude-sonnet-4-20250514"
             
-            with self.anthropic_client.messages.stream(
+            request_kwargs = {}
+            if system:
+                # Mark the static prefix for Anthropic prompt caching
+                request_kwargs["system"] = [{
+                    "type": "text",
+                    "text": system,
+                    "cache_control": {"type": "ephemeral"}
+                }]
+            
+            async with self.async_anthropic_client.messages.stream(
                 model=model_to_use,
                 max_tokens=max_tokens,
                 temperature=temperature,
-                messages=[{"role": "user", "content": prompt}]
+                messages=[{"role": "user", "content": prompt}],
+                **request_kwargs
             ) as stream:
-                for text in stream.text_stream:
+                async for text in stream.text_stream:
                     yield {
                         "content": text,
                         "model": model_to_use,
@@ -401,20 +561,46 @@ class SimpleLLMClient:
             logger.error(f"Claude streaming API error: {e}")
             raise
     
-    async def _complete_openai(self, prompt: str, max_tokens: int, temperature: float) -> Dict[str, Any]:
+    async def _complete_openai(self, prompt: str, max_tokens: int, temperature: float, response_format: Optional[Dict[str, Any]] = None, system: Optional[str] = None, model_id: str = "gpt-4") -> Dict[str, Any]:
         """Complete using OpenAI GPT"""
         
         try:
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4",
-                messages=[{"role": "user", "content": prompt}],
+            # Static prefix first so OpenAI's automatic prefix cache can match it
+            messages = [{"role": "system", "content": system}] if system else []
+            messages.append({"role": "user", "content": prompt})
+            
+            request_kwargs = {}
+            if temperature == 0:
+                # Greedy decoding: a fixed seed makes OpenAI's output reproducible as well
+                request_kwargs["seed"] = 0
+            if response_format:
+                # gpt-4 has no JSON mode - force a function call with the response schema as parameters
+                request_kwargs["tools"] = [{
+                    "type": "function",
+                    "function": {
+                        "name": STRUCTURED_OUTPUT_TOOL,
+                        "description": "Return the response as structured JSON",
+                        "parameters": response_format
+                    }
+                }]
+                request_kwargs["tool_choice"] = {"type": "function", "function": {"name": STRUCTURED_OUTPUT_TOOL}}
+            
+            # The SDK call is blocking - run it off the event loop
+            response = await asyncio.to_thread(
+                self.openai_client.chat.completions.create,
+                model=model_id,
+                messages=messages,
                 max_tokens=max_tokens,
-                temperature=temperature
+                temperature=temperature,
+                **request_kwargs
             )
             
+            message = response.choices[0].message
+            content = message.tool_calls[0].function.arguments if response_format else message.content
+            
             return {
-                "content": response.choices[0].message.content,
-                "model": "gpt-4",
+                "content": content,
+                "model": model_id,
                 "tokens_used": response.usage.total_tokens
             }
             
@@ -422,25 +608,30 @@ class SimpleLLMClient:
             logger.error(f"OpenAI API error: {e}")
             raise
     
-    async def _stream_openai(self, prompt: str, max_tokens: int, temperature: float):
+    async def _stream_openai(self, prompt: str, max_tokens: int, temperature: float, system: Optional[str] = None):
         """Stream using OpenAI GPT"""
         
         try:
-            stream = self.openai_client.chat.completions.create(
+            messages = [{"role": "system", "content": system}] if system else []
+            messages.append({"role": "user", "content": prompt})
+            
+            stream = await self.async_openai_client.chat.completions.create(
                 model="gpt-4",
-                messages=[{"role": "user", "content": prompt}],
+                messages=messages,
                 max_tokens=max_tokens,
                 temperature=temperature,
                 stream=True
             )
             
-            for chunk in stream:
-                if chunk.choices[0].delta.content is not None:
-                    yield {
-                        "content": chunk.choices[0].delta.content,
-                        "model": "gpt-4",
-                        "done": False
-                    }
+            # Closing the stream (also on aclose) drops the HTTP response mid-generation
+            async with stream:
+                async for chunk in stream:
+                    if chunk.choices[0].delta.content is not None:
+                        yield {
+                            "content": chunk.choices[0].delta.content,
+                            "model": "gpt-4",
+                            "done": False
+                        }
             
             # Final chunk to indicate completion
             yield {
@@ -456,9 +647,25 @@ class SimpleLLMClient:
 # Global LLM client instance (with fallback to environment variables)
 llm_client = SimpleLLMClient()
 
+# Clients built from user-provided keys, reused so provider SDK connection pools survive across calls
+_CLIENT_POOL_SIZE = 32
+_client_pool: "OrderedDict[str, SimpleLLMClient]" = OrderedDict()
+
 def create_llm_client(api_keys: dict) -> SimpleLLMClient:
-    """Create LLM client with user-provided API keys"""
-    return SimpleLLMClient(api_keys=api_keys)
+    """Get an LLM client for user-provided API keys (pooled by a hash of the keys)"""
+    key = hashlib.blake2b(
+        json.dumps(sorted((api_keys or {}).items()), default=str).encode(),
+        digest_size=16
+    ).hexdigest()
+    client = _client_pool.get(key)
+    if client is None:
+        client = SimpleLLMClient(api_keys=api_keys)
+        _client_pool[key] = client
+        if len(_client_pool) > _CLIENT_POOL_SIZE:
+            _client_pool.popitem(last=False)
+    else:
+        _client_pool.move_to_end(key)
+    return client
 
 # TODO: Team Member 1 - Enhanced LLM router with advanced features
 # class EnhancedLLMRouter(SimpleLLMClient):
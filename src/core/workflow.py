@@ -105,8 +105,8 @@ class EnhancedWorkflowOrchestrator:
                 }
             }
             
-            # Use lawyer agent to process the bulk analysis
-            result = await self.lawyer_agent.handle_user_query(query_data)
+            # Use lawyer agent to process the bulk analysis - the report is saved, so no context-free draft
+            result = await self.lawyer_agent.handle_user_query(query_data, hedge=False)
             
             return {
                 "document_name": f"Requirements-{requirements_document_id}",
@@ -150,8 +150,8 @@ class EnhancedWorkflowOrchestrator:
                 }
             }
             
-            # Use lawyer agent to process the bulk analysis
-            result = await self.lawyer_agent.handle_user_query(query_data)
+            # Use lawyer agent to process the bulk analysis - the report is saved, so no context-free draft
+            result = await self.lawyer_agent.handle_user_query(query_data, hedge=False)
             
             return {
                 "document_name": f"Legal-{legal_document_id}",
@@ -4,10 +4,13 @@ Main entry point for the Geo-Regulation AI System API
 """
 from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from contextlib import asynccontextmanager
 from datetime import datetime
 import logging
+import logging.handlers
+import queue
+import json
 
 from .config import settings
 from .core.models import (
@@ -17,12 +20,19 @@ from .core.models import (
 )
 from .core.workflow import workflow_orchestrator
 from .core.llm_service import llm_client, GEMINI_MODELS, CLAUDE_MODELS
+from .core.agents.real_mcp_client import start_shared_mcp_client, close_shared_mcp_client
 
 # Configure logging
 logging.basicConfig(
     level=getattr(logging, settings.log_level),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
+# Hand records to a background thread so handler I/O never blocks the event loop
+_log_queue = queue.SimpleQueue()
+_root_logger = logging.getLogger()
+_log_listener = logging.handlers.QueueListener(_log_queue, *_root_logger.handlers, respect_handler_level=True)
+_root_logger.handlers = [logging.handlers.QueueHandler(_log_queue)]
+_log_listener.start()
 logger = logging.getLogger(__name__)
 
 @asynccontextmanager
@@ -32,12 +42,14 @@ async def lifespan(app: FastAPI):
     logger.info(f"Environment: {settings.environment}")
     logger.info(f"Feature flags - Batch Processing: {settings.enable_batch_processing}")
     
-    # TODO: Team Member - Initialize MCP clients (always real MCPs now)
-    # await initialize_mcp_clients()
+    # Persistent MCP server sessions, shared by every LawyerAgent
+    await start_shared_mcp_client()
     
     yield
     
     logger.info("Shutting down Geo-Regulation AI System")
+    await close_shared_mcp_client()
+    _log_listener.stop()
 
 # Create FastAPI application
 app = FastAPI(
@@ -183,6 +195,29 @@ async def handle_user_query(request: UserQueryRequest):
             ).model_dump()
         )
 
+@app.post("/api/v1/query/stream")
+async def stream_user_query(request: UserQueryRequest):
+    """
+    Streaming variant of /api/v1/query
+    Server-sent events: token chunks as the advice is generated, then a complete event
+    """
+    
+    logger.info(f"Streaming user query: {request.query[:50]}...")
+    
+    async def generate_stream():
+        try:
+            async for event in workflow_orchestrator.lawyer_agent.stream_user_query(request.model_dump()):
+                yield f"data: {json.dumps(event)}\n\n"
+        except Exception as e:
+            logger.error(f"Streaming user query failed: {str(e)}")
+            yield f"data: {json.dumps({'type': 'error', 'message': f'Query processing failed: {str(e)}'})}\n\n"
+    
+    return StreamingResponse(
+        generate_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
 # PDF analysis endpoint (placeholder)
 @app.post("/api/v1/analyze-pdf")
 async def analyze_pdf(request: PDFAnalysisRequest):